@@ -0,0 +1,167 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from src.graphs.algorithms import bfs, dfs, dijkstra, bellman_ford, motor_caminhos
+from src.graphs.graph import Graph
+from src.graphs.io import load_adjacencias
+from src.geradores import gerar_adjacencias_bairros
+
+TAMANHOS_PADRAO = [1_000, 10_000, 100_000]
+
+
+def construir(arestas):
+    grafo = Graph()
+    grafo.add_edges(arestas)
+    return grafo
+
+
+def medir(funcao, repeticoes, aquecimento):
+    for _ in range(aquecimento):
+        funcao()
+
+    tempos = []
+    for _ in range(repeticoes):
+        t0 = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - t0)
+
+    tracemalloc.start()
+    try:
+        funcao()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    tempos.sort()
+    indice_p95 = min(len(tempos) - 1, int(round(0.95 * (len(tempos) - 1))))
+    return {
+        "mediana": statistics.median(tempos),
+        "p95": tempos[indice_p95],
+        "minimo": tempos[0],
+        "repeticoes": repeticoes,
+        "pico_memoria_bytes": pico,
+    }
+
+
+def casos(arestas, csv_path):
+    grafo = construir(arestas)
+    adj = grafo.adj
+    origem = arestas[0][0]
+    caminhos = motor_caminhos(adj)
+
+    return [
+        ("construcao_graph", lambda: construir(arestas)),
+        ("load_adjacencias", lambda: load_adjacencias(csv_path)),
+        ("bfs", lambda: bfs(adj, origem)),
+        ("dfs", lambda: dfs(adj, origem)),
+        ("dijkstra", lambda: dijkstra(adj, origem)),
+        ("dijkstra_binario", lambda: dijkstra(adj, origem, fila="binario")),
+        ("dijkstra_4ario", lambda: dijkstra(adj, origem, fila="4-ario")),
+        ("dijkstra_pareamento", lambda: dijkstra(adj, origem, fila="pareamento")),
+        ("dial", lambda: caminhos(adj, origem)),
+        ("bellman_ford", lambda: bellman_ford(adj, origem)),
+    ]
+
+
+def rodar(tamanhos, repeticoes, aquecimento, semente, filtro=None):
+    resultados = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for num_arestas in tamanhos:
+            csv_path = os.path.join(tmp, f"adj_{num_arestas}.csv")
+            gerar_adjacencias_bairros(csv_path, num_arestas, semente)
+            arestas = [(u, v, peso) for u, v, _, _, peso in load_adjacencias(csv_path)]
+            num_nos = len(construir(arestas).nodes())
+
+            for nome, funcao in casos(arestas, csv_path):
+                if filtro and nome not in filtro:
+                    continue
+                medida = medir(funcao, repeticoes, aquecimento)
+                resultados.append({"caso": nome, "arestas": num_arestas, "nos": num_nos, **medida})
+                print(
+                    f"{nome:<20} E={num_arestas:<9} mediana={medida['mediana'] * 1000:9.3f} ms "
+                    f"p95={medida['p95'] * 1000:9.3f} ms pico={medida['pico_memoria_bytes'] / 1024:10.1f} KiB"
+                )
+
+    return resultados
+
+
+def commit_atual():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def chave(resultado):
+    return resultado["caso"], resultado["arestas"]
+
+
+def comparar(base, atual, tolerancia):
+    referencia = {chave(r): r for r in base["resultados"]}
+    regressoes = []
+
+    for r in atual["resultados"]:
+        anterior = referencia.get(chave(r))
+        if anterior is None or anterior["mediana"] == 0:
+            continue
+        razao = r["mediana"] / anterior["mediana"]
+        marca = ""
+        if razao > 1 + tolerancia:
+            marca = "  <-- regressão"
+            regressoes.append(chave(r))
+        print(f"{r['caso']:<20} E={r['arestas']:<9} {razao:6.2f}x{marca}")
+
+    return regressoes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks dos algoritmos de grafos")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=TAMANHOS_PADRAO, help="Número de arestas de cada grafo")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--aquecimento", type=int, default=1)
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--casos", nargs="+", help="Rodar apenas estes casos")
+    parser.add_argument("--saida", default="out/benchmark.json")
+    parser.add_argument("--comparar", help="JSON de uma execução anterior para comparação")
+    parser.add_argument("--tolerancia", type=float, default=0.10, help="Aumento relativo da mediana aceito antes de acusar regressão")
+    args = parser.parse_args(argv)
+
+    resultados = rodar(args.tamanhos, args.repeticoes, args.aquecimento, args.semente, args.casos)
+    relatorio = {
+        "metadados": {
+            "commit": commit_atual(),
+            "python": sys.version.split()[0],
+            "plataforma": platform.platform(),
+            "data": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "semente": args.semente,
+        },
+        "resultados": resultados,
+    }
+
+    os.makedirs(os.path.dirname(args.saida) or ".", exist_ok=True)
+    with open(args.saida, "w", encoding="utf-8") as f:
+        json.dump(relatorio, f, ensure_ascii=False, indent=2)
+    print(f"Resultados salvos em {args.saida}")
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as f:
+            base = json.load(f)
+        if comparar(base, relatorio, args.tolerancia):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
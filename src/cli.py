@@ -1,20 +1,170 @@
 import argparse
-from src.solve import init
-from src.viz import init_visualizacao, gerar_index_html, gerar_visualizacao_parte2
-from src.parte2_algoritmos import main as parte2_main  
+import glob
+from functools import lru_cache
+
+from src.solve import gerar_hierarquia_contracao, init, rota
+from src.viz import (
+    gerar_arvore_percurso_html,
+    gerar_grafo_interativo_html,
+    gerar_index_html,
+    gerar_subgrafo_top10_grau_html,
+    gerar_visualizacao_parte2,
+    plot_histograma_graus,
+    plot_top10_grau,
+)
+from src.parte2_algoritmos import main as parte2_main
+from src.graphs.io import load_voos
+from src.pipeline import Etapa, Pipeline
+from src.graphs.perfil import Perfil
+
+CAMINHO_DATASET_VOOS = "data/dataset_parte2/adjacencias_voos.csv"
+CODIGO_GRAFOS = sorted(glob.glob("src/graphs/*.py"))
+
+@lru_cache(maxsize=None)
+def carregar_dataset_voos():
+    return load_voos(CAMINHO_DATASET_VOOS)
+
+def rodar_parte2():
+    parte2_main(carregar_dataset_voos())
+
+def rodar_visualizacao_parte2():
+    gerar_visualizacao_parte2(carregar_dataset_voos())
+
+def etapas_construir():
+    saidas_parte1 = [
+        "data/bairros_unique.csv",
+        "out/recife_global.json",
+        "out/microrregioes.json",
+        "out/graus.csv",
+        "out/ego_bairro.csv",
+        "out/ranking_bairros.json",
+        "out/distancias_enderecos.csv",
+        "out/percurso_nova_descoberta_setubal.json",
+    ]
+    saidas_parte2 = [
+        "out/parte2_dataset_info.json",
+        "out/bfs_resultados.json",
+        "out/dfs_resultados.json",
+        "out/bfs_dfs_resultados.json",
+        "out/dijkstra_resultados.json",
+        "out/bellman_ford_resultados.json",
+        "out/parte2_report.json",
+        "out/parte2_histograma_graus_voos.png",
+    ]
+
+    etapas = [
+        Etapa(
+            "parte1_dados",
+            init,
+            [
+                "data/bairros_recife.csv",
+                "data/adjacencias_bairros.csv",
+                "data/enderecos.csv",
+                "src/solve.py",
+                *CODIGO_GRAFOS,
+            ],
+            saidas_parte1,
+        ),
+        Etapa(
+            "hierarquia_contracao",
+            gerar_hierarquia_contracao,
+            ["data/adjacencias_bairros.csv", "src/solve.py", *CODIGO_GRAFOS],
+            ["out/hierarquia_contracao.json"],
+        ),
+        Etapa(
+            "arvore_percurso",
+            gerar_arvore_percurso_html,
+            ["out/percurso_nova_descoberta_setubal.json", "src/viz.py"],
+            ["out/arvore_percurso.html"],
+        ),
+        Etapa(
+            "grafo_interativo",
+            gerar_grafo_interativo_html,
+            [
+                "data/adjacencias_bairros.csv",
+                "data/bairros_unique.csv",
+                "out/ego_bairro.csv",
+                "out/ranking_bairros.json",
+                "out/percurso_nova_descoberta_setubal.json",
+                "src/viz.py",
+                "src/solve.py",
+                *CODIGO_GRAFOS,
+            ],
+            ["out/grafo_interativo.html"],
+        ),
+        Etapa(
+            "histograma_graus",
+            plot_histograma_graus,
+            ["out/graus.csv", "src/viz.py"],
+            ["out/histograma_graus.png"],
+        ),
+        Etapa(
+            "top10_grau",
+            plot_top10_grau,
+            ["out/graus.csv", "src/viz.py"],
+            ["out/top10_grau.png"],
+        ),
+        Etapa(
+            "subgrafo_top10_grau",
+            gerar_subgrafo_top10_grau_html,
+            ["data/adjacencias_bairros.csv", "out/graus.csv", "src/viz.py", "src/solve.py", *CODIGO_GRAFOS],
+            ["out/subgrafo_top10_grau.html"],
+        ),
+        Etapa(
+            "parte2_algoritmos",
+            rodar_parte2,
+            [CAMINHO_DATASET_VOOS, "src/parte2_algoritmos.py", "src/viz.py", *CODIGO_GRAFOS],
+            saidas_parte2,
+        ),
+        Etapa(
+            "parte2_visualizacao",
+            rodar_visualizacao_parte2,
+            [CAMINHO_DATASET_VOOS, "out/bfs_dfs_resultados.json", "src/viz.py", *CODIGO_GRAFOS],
+            ["out/parte2_grafo_voos_bfs_dfs.html"],
+        ),
+    ]
+
+    artefatos = sorted({saida for etapa in etapas for saida in etapa.saidas})
+    etapas.append(
+        Etapa("index", gerar_index_html, [*artefatos, "src/viz.py"], ["out/index.html"])
+    )
+
+    return etapas
 
 def main():
     parser = argparse.ArgumentParser(description="Processa grafos de bairros do Recife")
     parser.add_argument('--construir', action='store_true', help='Construir adjacências e endereços')
+    parser.add_argument('--forcar', action='store_true', help='Refazer todas as etapas, mesmo sem mudanças')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='Número de processos para etapas independentes')
+    parser.add_argument('--profile', nargs='?', const='out/perfil.json', metavar='ARQUIVO', help='Gravar tempos, memória e contadores de cada etapa em JSON')
+    parser.add_argument('--rota', nargs=2, metavar=('ORIGEM', 'DESTINO'), help='Menor caminho entre dois bairros pela hierarquia de contração')
+    parser.add_argument('--cprofile', nargs='?', const='out/perfil', metavar='DIR', help='Gravar também um dump do cProfile por etapa')
     args = parser.parse_args()
 
-    if args.construir:
-        init()
-        init_visualizacao()
-        parte2_main()
-        gerar_visualizacao_parte2()
-        gerar_index_html()          
-        print("O projeto foi inicializado com Sucesso")
+    if args.rota:
+        custo, caminho = rota(*args.rota)
+        if caminho:
+            print(f"Custo: {custo}")
+            print("Caminho: " + " -> ".join(caminho))
+        else:
+            print(f"Não há caminho entre {args.rota[0]} e {args.rota[1]}.")
+    elif args.construir:
+        perfil = None
+        if args.profile or args.cprofile:
+            perfil = Perfil(args.cprofile)
+
+        status = Pipeline(etapas_construir()).executar(
+            forcar=args.forcar, processos=args.jobs, perfil=perfil
+        )
+
+        if perfil is not None:
+            destino = args.profile or "out/perfil.json"
+            perfil.salvar(destino)
+            print(f"Perfil de execução salvo em {destino}")
+        if all(s in ("executada", "atualizada") for s in status.values()):
+            print("O projeto foi inicializado com Sucesso")
+        else:
+            print("Algumas etapas falharam; veja as mensagens acima.")
     else:
         print("Use --construir para gerar os arquivos de adjacências e endereços.")
 
@@ -0,0 +1,136 @@
+import argparse
+import math
+import os
+import random
+from itertools import accumulate
+
+TIPOS_VIA = [
+    ("Rua", 2.0, 70),
+    ("Avenida", 4.0, 14),
+    ("Ponte", 1.0, 8),
+    ("Estrada", 1.5, 5),
+    ("Viaduto", 3.0, 2),
+    ("Rodovia", 5.0, 1),
+]
+
+TAMANHO_LOTE = 10_000
+
+
+def _abrir_saida(filepath):
+    diretorio = os.path.dirname(filepath)
+    if diretorio:
+        os.makedirs(diretorio, exist_ok=True)
+    return open(filepath, "w", encoding="utf-8", newline="")
+
+
+def _sorteios(rnd, populacao, acumulado):
+    while True:
+        yield from rnd.choices(populacao, cum_weights=acumulado, k=TAMANHO_LOTE)
+
+
+def gerar_adjacencias_bairros(filepath, num_arestas, semente=42):
+    rnd = random.Random(semente)
+    lado = max(2, math.ceil(math.sqrt(num_arestas / 2)) + 1)
+    tipos = _sorteios(rnd, TIPOS_VIA, list(accumulate(peso for _, _, peso in TIPOS_VIA)))
+    escritas = 0
+
+    with _abrir_saida(filepath) as f:
+        for linha in range(lado):
+            for coluna in range(lado):
+                vizinhos = []
+                if coluna + 1 < lado:
+                    vizinhos.append((linha, coluna + 1))
+                if linha + 1 < lado:
+                    vizinhos.append((linha + 1, coluna))
+
+                for outra_linha, outra_coluna in vizinhos:
+                    if escritas >= num_arestas:
+                        return escritas
+                    tipo, peso, _ = next(tipos)
+                    f.write(
+                        f"Bairro {linha}-{coluna}, Bairro {outra_linha}-{outra_coluna}, "
+                        f"{tipo} {escritas}, “Acesso por {tipo}”, {peso}\n"
+                    )
+                    escritas += 1
+
+    return escritas
+
+
+def gerar_adjacencias_voos(
+    filepath,
+    num_arestas,
+    num_cidades=None,
+    ciclos_negativos=0,
+    expoente=1.2,
+    semente=42,
+):
+    rnd = random.Random(semente)
+    if num_cidades is None:
+        num_cidades = max(5, int(math.sqrt(num_arestas)))
+
+    cidades = [f"Cidade {i:06d}" for i in range(num_cidades)]
+    acumulado = list(accumulate(1.0 / (i + 1) ** expoente for i in range(num_cidades)))
+    potencial = [rnd.randint(0, 4000) for _ in range(num_cidades)]
+    escritas = 0
+
+    with _abrir_saida(filepath) as f:
+        f.write("Origem, Destino, Classe, Peso\n")
+
+        while escritas < num_arestas:
+            lote = min(TAMANHO_LOTE, num_arestas - escritas)
+            origens = rnd.choices(range(num_cidades), cum_weights=acumulado, k=lote)
+            destinos = rnd.choices(range(num_cidades), cum_weights=acumulado, k=lote)
+
+            for u, v in zip(origens, destinos):
+                if u == v:
+                    v = (v + 1) % num_cidades
+                centavos = rnd.randint(1, 3000) - potencial[u] + potencial[v]
+                classe = "Economica" if centavos < 0 else "Executiva"
+                f.write(f"{cidades[u]}, {cidades[v]}, {classe}, {abs(centavos) / 100:.2f}\n")
+                escritas += 1
+
+        for _ in range(ciclos_negativos):
+            a, b, c = rnd.sample(range(num_cidades), 3)
+            for u, v in ((a, b), (b, c), (c, a)):
+                f.write(f"{cidades[u]}, {cidades[v]}, Economica, {rnd.randint(100, 2000) / 100:.2f}\n")
+                escritas += 1
+
+    return escritas
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera datasets sintéticos nos formatos do projeto")
+    sub = parser.add_subparsers(dest="tipo", required=True)
+
+    bairros = sub.add_parser("bairros", help="Malha viária no formato de adjacencias_bairros.csv")
+    bairros.add_argument("--arestas", type=int, required=True)
+    bairros.add_argument("--saida", required=True)
+    bairros.add_argument("--semente", type=int, default=42)
+
+    voos = sub.add_parser("voos", help="Rede de voos hub-and-spoke no formato de adjacencias_voos.csv")
+    voos.add_argument("--arestas", type=int, required=True)
+    voos.add_argument("--saida", required=True)
+    voos.add_argument("--cidades", type=int)
+    voos.add_argument("--ciclos-negativos", type=int, default=0)
+    voos.add_argument("--expoente", type=float, default=1.2)
+    voos.add_argument("--semente", type=int, default=42)
+
+    args = parser.parse_args(argv)
+
+    if args.tipo == "bairros":
+        total = gerar_adjacencias_bairros(args.saida, args.arestas, args.semente)
+    else:
+        total = gerar_adjacencias_voos(
+            args.saida,
+            args.arestas,
+            num_cidades=args.cidades,
+            ciclos_negativos=args.ciclos_negativos,
+            expoente=args.expoente,
+            semente=args.semente,
+        )
+
+    print(f"{total} arestas escritas em {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,10 @@
+from collections import deque
+from functools import partial
 from heapq import heappush, heappop
 
+from src.graphs.filas import criar_fila
+from src.graphs.perfil import contar
+
 def _extract_neighbors(raw_neighbors):
     resultado = []
 
@@ -11,93 +16,616 @@ def _extract_neighbors(raw_neighbors):
 
     return resultado
 
-def bfs(graph, start_node):
-    visitados = set()
-    fila = [start_node]
+def bfs(graph, start_node, destino=None, profundidade_max=None):
+    ordem, camadas, _ = bfs_arvore(graph, start_node, destino, profundidade_max)
+    return ordem, camadas
+
+def bfs_arvore(graph, start_node, destino=None, profundidade_max=None):
+    fila = deque([start_node])
     ordem = []
     camadas = {start_node: 0}
+    pais = {start_node: None}
 
     while fila:
-        node = fila.pop(0)
-        if node not in visitados:
-            visitados.add(node)
-            ordem.append(node)
+        node = fila.popleft()
+        ordem.append(node)
 
-            vizinhos = _extract_neighbors(graph.get(node, []))
-            for viz in vizinhos:
-                if viz not in visitados and viz not in fila:
-                    camadas[viz] = camadas[node] + 1
-                    fila.append(viz)
+        if node == destino:
+            break
 
-    return ordem, camadas
+        camada = camadas[node]
+        if profundidade_max is not None and camada >= profundidade_max:
+            continue
+
+        for viz in _extract_neighbors(graph.get(node, [])):
+            if viz not in camadas:
+                camadas[viz] = camada + 1
+                pais[viz] = node
+                fila.append(viz)
+
+    return ordem, camadas, pais
+
+def reconstruir_caminho(pais, destino):
+    if destino not in pais:
+        return []
+
+    caminho = []
+    atual = destino
+    while atual is not None:
+        caminho.append(atual)
+        atual = pais[atual]
+    caminho.reverse()
+
+    return caminho
 
 def dfs(graph, start_node):
-    visitados = set()
+    resultado = dfs_completo(graph, [start_node])
+    return resultado["ordem"], resultado["arestas"]["retorno"]
+
+def dfs_completo(graph, raizes=None):
+    if raizes is None:
+        raizes = list(graph)
+
+    tempo = 0
     ordem = []
-    pilha_rec = set()
-    ciclos = []
+    descoberta = {}
+    finalizacao = {}
+    arestas = {"arvore": [], "retorno": [], "avanco": [], "cruzamento": []}
 
-    def explorar(node):
-        visitados.add(node)
-        pilha_rec.add(node)
-        ordem.append(node)
+    for raiz in raizes:
+        if raiz in descoberta:
+            continue
 
-        vizinhos = _extract_neighbors(graph.get(node, []))
+        descoberta[raiz] = tempo
+        tempo += 1
+        ordem.append(raiz)
+        pilha = [(raiz, iter(_extract_neighbors(graph.get(raiz, []))))]
 
-        for viz in vizinhos:
-            if viz not in visitados:
-                explorar(viz)
-            elif viz in pilha_rec:
-                ciclos.append((node, viz))
+        while pilha:
+            node, vizinhos = pilha[-1]
 
-        pilha_rec.remove(node)
+            for viz in vizinhos:
+                if viz not in descoberta:
+                    arestas["arvore"].append((node, viz))
+                    descoberta[viz] = tempo
+                    tempo += 1
+                    ordem.append(viz)
+                    pilha.append((viz, iter(_extract_neighbors(graph.get(viz, [])))))
+                    break
+                elif viz not in finalizacao:
+                    arestas["retorno"].append((node, viz))
+                elif descoberta[node] < descoberta[viz]:
+                    arestas["avanco"].append((node, viz))
+                else:
+                    arestas["cruzamento"].append((node, viz))
+            else:
+                pilha.pop()
+                finalizacao[node] = tempo
+                tempo += 1
 
-    explorar(start_node)
-    return ordem, ciclos
+    return {
+        "ordem": ordem,
+        "descoberta": descoberta,
+        "finalizacao": finalizacao,
+        "arestas": arestas,
+    }
+
+def dijkstra(grafo, origem, destino=None, predecessores=False, fila=None):
+    if fila is not None:
+        return _dijkstra_com_fila(grafo, origem, destino, predecessores, criar_fila(fila))
 
-def dijkstra(grafo, origem):
     distancias = {no: float("inf") for no in grafo}
-    distancias[origem] = 0
+    distancias[origem] = 0.0
+    anteriores = {origem: None}
 
-    heap = [(0, origem)]
+    heap = [(0.0, origem)]
+    extracoes = fixados = arestas = 0
+    insercoes = 1
 
     while heap:
         distancia_atual, u = heappop(heap)
+        extracoes += 1
 
         if distancia_atual > distancias[u]:
             continue
 
-        for v, peso in grafo[u]:
+        fixados += 1
+        if u == destino:
+            break
+
+        for v, peso in grafo.get(u, ()):
+            arestas += 1
             if peso < 0:
                 raise ValueError("Dijkstra não suporta arestas com peso negativo")
 
             nova_distancia = distancia_atual + peso
             if nova_distancia < distancias[v]:
                 distancias[v] = nova_distancia
+                anteriores[v] = u
                 heappush(heap, (nova_distancia, v))
+                insercoes += 1
+
+    contar(
+        "dijkstra",
+        chamadas=1,
+        nos_fixados=fixados,
+        arestas_relaxadas=arestas,
+        insercoes_heap=insercoes,
+        extracoes_heap=extracoes,
+        extracoes_obsoletas=extracoes - fixados,
+    )
 
+    if predecessores:
+        return distancias, anteriores
     return distancias
 
-def bellman_ford(grafo, origem):
+def _dijkstra_com_fila(grafo, origem, destino, predecessores, fila):
+    distancias = {no: float("inf") for no in grafo}
+    distancias[origem] = 0.0
+    anteriores = {origem: None}
+    fixados = arestas = 0
+
+    fila.inserir_ou_diminuir(origem, 0.0)
+
+    while fila:
+        distancia_atual, u = fila.extrair()
+        fixados += 1
+
+        if u == destino:
+            break
+
+        for v, peso in grafo.get(u, ()):
+            arestas += 1
+            if peso < 0:
+                raise ValueError("Dijkstra não suporta arestas com peso negativo")
+
+            nova_distancia = distancia_atual + peso
+            if nova_distancia < distancias[v]:
+                distancias[v] = nova_distancia
+                anteriores[v] = u
+                fila.inserir_ou_diminuir(v, nova_distancia)
+
+    contadores = fila.contadores
+    contar(
+        "dijkstra",
+        chamadas=1,
+        nos_fixados=fixados,
+        arestas_relaxadas=arestas,
+        insercoes_heap=contadores["insercoes"],
+        diminuicoes_heap=contadores["diminuicoes"],
+        extracoes_heap=contadores["extracoes"],
+        extracoes_obsoletas=contadores["extracoes_obsoletas"],
+    )
+
+    if predecessores:
+        return distancias, anteriores
+    return distancias
+
+LIMITE_DIAL = 1000
+ESCALAS_DIAL = (1, 2, 4, 8)
+
+def escala_inteira(grafo, limite=LIMITE_DIAL):
+    pesos = {peso for u in grafo for _, peso in grafo[u]}
+    if any(peso < 0 for peso in pesos):
+        return None
+
+    for escala in ESCALAS_DIAL:
+        if all(float(peso * escala).is_integer() and peso * escala <= limite for peso in pesos):
+            return escala
+    return None
+
+def dial(grafo, origem, destino=None, predecessores=False, escala=1, tamanho=None):
+    if tamanho is None:
+        tamanho = int(max((peso for u in grafo for _, peso in grafo[u]), default=0) * escala) + 1
+
     distancias = {no: float("inf") for no in grafo}
-    distancias[origem] = 0
-    arestas = []
-
-    for origem_no in grafo:
-        for destino_no, peso in grafo[origem_no]:
-            arestas.append((origem_no, destino_no, peso))
-
-    for _ in range(len(grafo) - 1):
-        mudou = False
-        for origem_no, destino_no, peso in arestas:
-            if distancias[origem_no] + peso < distancias[destino_no]:
-                distancias[destino_no] = distancias[origem_no] + peso
-                mudou = True
-        if not mudou:
+    distancias[origem] = 0.0
+    anteriores = {origem: None}
+
+    baldes = [[] for _ in range(tamanho)]
+    baldes[0].append((0.0, origem))
+    pendentes = 1
+    atual = 0
+    extracoes = fixados = arestas = 0
+
+    while pendentes:
+        balde = baldes[atual % tamanho]
+        if len(balde) > 1:
+            balde.sort(reverse=True)
+
+        while balde:
+            distancia_atual, u = balde.pop()
+            pendentes -= 1
+            extracoes += 1
+
+            if distancia_atual > distancias[u]:
+                continue
+
+            fixados += 1
+            if u == destino:
+                pendentes = 0
+                break
+
+            for v, peso in grafo.get(u, ()):
+                arestas += 1
+                if peso < 0:
+                    raise ValueError("Dijkstra não suporta arestas com peso negativo")
+
+                nova_distancia = distancia_atual + peso
+                if nova_distancia < distancias[v]:
+                    distancias[v] = nova_distancia
+                    anteriores[v] = u
+                    baldes[int(nova_distancia * escala) % tamanho].append((nova_distancia, v))
+                    pendentes += 1
+
+        atual += 1
+
+    contar(
+        "dial",
+        chamadas=1,
+        nos_fixados=fixados,
+        arestas_relaxadas=arestas,
+        extracoes_baldes=extracoes,
+        baldes_percorridos=atual,
+    )
+
+    if predecessores:
+        return distancias, anteriores
+    return distancias
+
+def motor_caminhos(grafo, limite=LIMITE_DIAL):
+    escala = escala_inteira(grafo, limite)
+    if escala is None:
+        return dijkstra
+
+    peso_max = max((peso for u in grafo for _, peso in grafo[u]), default=0)
+    return partial(dial, escala=escala, tamanho=int(peso_max * escala) + 1)
+
+def caminho_minimo(grafo, origem, destino, fila=None):
+    distancias, anteriores = dijkstra(grafo, origem, destino, predecessores=True, fila=fila)
+    custo = distancias.get(destino, float("inf"))
+
+    if custo == float("inf"):
+        return custo, []
+
+    return custo, reconstruir_caminho(anteriores, destino)
+
+def grafo_reverso(grafo):
+    reverso = {no: [] for no in grafo}
+
+    for u in grafo:
+        for v, peso in grafo[u]:
+            reverso.setdefault(v, []).append((u, peso))
+
+    return reverso
+
+def dijkstra_bidirecional(grafo, origem, destino, reverso=None):
+    if origem == destino:
+        return 0.0, [origem]
+
+    if reverso is None:
+        reverso = grafo_reverso(grafo)
+
+    inf = float("inf")
+    adjacencias = (grafo, reverso)
+    distancias = ({origem: 0.0}, {destino: 0.0})
+    anteriores = ({origem: None}, {destino: None})
+    heaps = ([(0.0, origem)], [(0.0, destino)])
+    melhor = inf
+    encontro = None
+    extracoes = fixados = arestas = 0
+    insercoes = 2
+
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= melhor:
+            break
+
+        lado = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+        dist = distancias[lado]
+        dist_outro = distancias[1 - lado]
+        ant = anteriores[lado]
+
+        distancia_atual, u = heappop(heaps[lado])
+        extracoes += 1
+        if distancia_atual > dist[u]:
+            continue
+
+        fixados += 1
+        for v, peso in adjacencias[lado].get(u, []):
+            arestas += 1
+            if peso < 0:
+                raise ValueError("Dijkstra não suporta arestas com peso negativo")
+
+            nova_distancia = distancia_atual + peso
+            if nova_distancia < dist.get(v, inf):
+                dist[v] = nova_distancia
+                ant[v] = u
+                heappush(heaps[lado], (nova_distancia, v))
+                insercoes += 1
+
+            if v in dist_outro and dist[v] + dist_outro[v] < melhor:
+                melhor = dist[v] + dist_outro[v]
+                encontro = v
+
+    contar(
+        "dijkstra_bidirecional",
+        chamadas=1,
+        nos_fixados=fixados,
+        arestas_relaxadas=arestas,
+        insercoes_heap=insercoes,
+        extracoes_heap=extracoes,
+        extracoes_obsoletas=extracoes - fixados,
+    )
+
+    if encontro is None:
+        return inf, []
+
+    ida = reconstruir_caminho(anteriores[0], encontro)
+    volta = reconstruir_caminho(anteriores[1], encontro)
+    volta.reverse()
+
+    return melhor, ida + volta[1:]
+
+def a_estrela(grafo, origem, destino, heuristica):
+    inf = float("inf")
+    distancias = {origem: 0.0}
+    anteriores = {origem: None}
+    heap = [(heuristica(origem, destino), 0.0, origem)]
+
+    while heap:
+        _, distancia_atual, u = heappop(heap)
+
+        if distancia_atual > distancias[u]:
+            continue
+
+        if u == destino:
+            return distancia_atual, reconstruir_caminho(anteriores, destino)
+
+        for v, peso in grafo.get(u, []):
+            if peso < 0:
+                raise ValueError("A* não suporta arestas com peso negativo")
+
+            nova_distancia = distancia_atual + peso
+            if nova_distancia < distancias.get(v, inf):
+                distancias[v] = nova_distancia
+                anteriores[v] = u
+                heappush(heap, (nova_distancia + heuristica(v, destino), nova_distancia, v))
+
+    return inf, []
+
+def escolher_landmarks(grafo, quantidade):
+    nos = list(grafo)
+    if not nos:
+        return []
+
+    inf = float("inf")
+    landmarks = [nos[0]]
+    menor_distancia = dijkstra(grafo, nos[0])
+
+    while len(landmarks) < min(quantidade, len(nos)):
+        candidatos = [
+            (d, no) for no, d in menor_distancia.items()
+            if d != inf and no not in landmarks
+        ]
+        if not candidatos:
             break
 
-    for origem_no, destino_no, peso in arestas:
-        if distancias[origem_no] + peso < distancias[destino_no]:
-            raise ValueError("Ciclo negativo detectado")
+        _, proximo = max(candidatos, key=lambda x: x[0])
+        landmarks.append(proximo)
+
+        for no, d in dijkstra(grafo, proximo).items():
+            if d < menor_distancia.get(no, inf):
+                menor_distancia[no] = d
+
+    return landmarks
+
+def heuristica_landmarks(grafo, landmarks, reverso=None):
+    if reverso is None:
+        reverso = grafo_reverso(grafo)
+
+    inf = float("inf")
+    tabelas = [(dijkstra(grafo, l), dijkstra(reverso, l)) for l in landmarks]
+
+    def heuristica(no, destino):
+        limite = 0.0
+
+        for desde_l, ate_l in tabelas:
+            d_l_destino = desde_l.get(destino, inf)
+            d_l_no = desde_l.get(no, inf)
+            if d_l_destino != inf and d_l_no != inf:
+                limite = max(limite, d_l_destino - d_l_no)
+
+            d_no_l = ate_l.get(no, inf)
+            d_destino_l = ate_l.get(destino, inf)
+            if d_no_l != inf and d_destino_l != inf:
+                limite = max(limite, d_no_l - d_destino_l)
+
+        return limite
+
+    return heuristica
+
+def bellman_ford(grafo, origem):
+    resultado = bellman_ford_fila(grafo, origem)
+
+    if resultado["ciclos"]:
+        raise ValueError("Ciclo negativo detectado")
+
+    return resultado["distancias"]
+
+def bellman_ford_fila(grafo, origem):
+    inf = float("inf")
+    distancias = {no: inf for no in grafo}
+    distancias[origem] = 0.0
+    anteriores = {origem: None}
+    arestas_no_caminho = {origem: 0}
+    fila = deque([origem])
+    na_fila = {origem}
+    ciclos = []
+    infinito_negativo = set()
+    retiradas = arestas = relaxacoes = 0
+
+    while fila:
+        u = fila.popleft()
+        na_fila.discard(u)
+        retiradas += 1
+
+        if u in infinito_negativo:
+            continue
+
+        distancia_u = distancias[u]
+        for v, peso in grafo.get(u, []):
+            arestas += 1
+            if v in infinito_negativo:
+                continue
+
+            nova_distancia = distancia_u + peso
+            if nova_distancia < distancias.get(v, inf):
+                relaxacoes += 1
+                distancias[v] = nova_distancia
+                anteriores[v] = u
+                arestas_no_caminho[v] = arestas_no_caminho[u] + 1
+
+                if arestas_no_caminho[v] >= len(distancias):
+                    ciclo = _extrair_ciclo(anteriores, v)
+                    if ciclo is not None:
+                        ciclos.append(ciclo)
+                        _propagar_infinito_negativo(grafo, ciclo, infinito_negativo, distancias)
+                        if u in infinito_negativo:
+                            break
+                        continue
+
+                if v not in na_fila:
+                    na_fila.add(v)
+                    fila.append(v)
+
+    contar(
+        "bellman_ford",
+        chamadas=1,
+        retiradas_fila=retiradas,
+        arestas_examinadas=arestas,
+        relaxacoes=relaxacoes,
+        ciclos_negativos=len(ciclos),
+    )
+
+    return {
+        "distancias": distancias,
+        "anteriores": anteriores,
+        "ciclos": ciclos,
+        "infinito_negativo": infinito_negativo,
+    }
+
+def potenciais_parciais(grafo):
+    virtual = object()
+    aumentado = {no: grafo.get(no, []) for no in grafo_reverso(grafo)}
+    aumentado[virtual] = [(no, 0.0) for no in list(aumentado)]
+
+    resultado = bellman_ford_fila(aumentado, virtual)
+    potenciais = {
+        no: distancia
+        for no, distancia in resultado["distancias"].items()
+        if no is not virtual and no not in resultado["infinito_negativo"]
+    }
+    return potenciais, resultado["ciclos"]
+
+def potenciais_johnson(grafo):
+    potenciais, ciclos = potenciais_parciais(grafo)
+    if ciclos:
+        return None
+    return potenciais
+
+def reponderar(grafo, potenciais):
+    return {
+        u: [
+            (v, max(0.0, peso + potenciais[u] - potenciais[v]))
+            for v, peso in grafo.get(u, [])
+            if v in potenciais
+        ]
+        for u in potenciais
+    }
+
+def dijkstra_reponderado(grafo, reponderado, potenciais, origem, ciclos=()):
+    if origem in reponderado:
+        distancias, anteriores = dijkstra(reponderado, origem, predecessores=True)
+        distancias.update(_distancias_pela_arvore(grafo, anteriores, origem))
+    else:
+        distancias = {no: float("inf") for no in reponderado}
+        distancias[origem] = 0.0
+        anteriores = {origem: None}
+
+    infinito_negativo = set()
+    alcancados = []
+    if ciclos:
+        _, alcancaveis = bfs(grafo, origem)
+        alcancados = [ciclo for ciclo in ciclos if ciclo[0] in alcancaveis]
+        for ciclo in alcancados:
+            _propagar_infinito_negativo(grafo, ciclo, infinito_negativo, distancias)
+
+        if any(no not in potenciais and no not in infinito_negativo for no in alcancaveis):
+            return None
+
+    return {
+        "distancias": distancias,
+        "anteriores": anteriores,
+        "ciclos": alcancados,
+        "infinito_negativo": infinito_negativo,
+    }
+
+def johnson(grafo, origens=None):
+    potenciais = potenciais_johnson(grafo)
+    if potenciais is None:
+        raise ValueError("Ciclo negativo detectado")
+
+    reponderado = reponderar(grafo, potenciais)
+    return {
+        origem: dijkstra_reponderado(grafo, reponderado, potenciais, origem)["distancias"]
+        for origem in (reponderado if origens is None else origens)
+    }
+
+def _distancias_pela_arvore(grafo, anteriores, origem):
+    distancias = {origem: 0.0}
+
+    for node in anteriores:
+        pendentes = []
+        while node not in distancias:
+            pendentes.append(node)
+            node = anteriores[node]
+
+        for filho in reversed(pendentes):
+            pai = anteriores[filho]
+            peso = min(p for v, p in grafo.get(pai, []) if v == filho)
+            distancias[filho] = distancias[pai] + peso
 
     return distancias
+
+def _extrair_ciclo(anteriores, node):
+    vistos = set()
+    atual = node
+
+    while atual is not None and atual not in vistos:
+        vistos.add(atual)
+        atual = anteriores.get(atual)
+
+    if atual is None:
+        return None
+
+    ciclo = [atual]
+    anterior = anteriores[atual]
+    while anterior != atual:
+        ciclo.append(anterior)
+        anterior = anteriores[anterior]
+    ciclo.reverse()
+
+    return ciclo
+
+def _propagar_infinito_negativo(grafo, ciclo, infinito_negativo, distancias):
+    fila = deque(no for no in ciclo if no not in infinito_negativo)
+    infinito_negativo.update(fila)
+
+    while fila:
+        node = fila.popleft()
+        distancias[node] = float("-inf")
+
+        for viz, _ in grafo.get(node, []):
+            if viz not in infinito_negativo:
+                infinito_negativo.add(viz)
+                fila.append(viz)
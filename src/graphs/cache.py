@@ -0,0 +1,107 @@
+import glob
+import hashlib
+import mmap
+import os
+import struct
+from array import array
+
+from src.graphs.graph import Graph
+from src.graphs.io import VERSAO_PARSER, hash_arquivo
+
+MAGICO = b"PGRF"
+VERSAO_FORMATO = 1
+CABECALHO = struct.Struct("<4sIIQQ")
+
+
+def _alinhar(n):
+    return (n + 7) & ~7
+
+
+def _prefixo_cache(filepath_csv, tipo, cache_dir):
+    base = os.path.splitext(os.path.basename(filepath_csv))[0]
+    origem = hashlib.sha256(os.path.abspath(filepath_csv).encode("utf-8")).hexdigest()[:8]
+    return os.path.join(cache_dir, f"{base}-{tipo}-{origem}")
+
+
+def caminho_cache(filepath_csv, tipo, cache_dir):
+    chave = hash_arquivo(filepath_csv)[:16]
+    return f"{_prefixo_cache(filepath_csv, tipo, cache_dir)}-{chave}-p{VERSAO_PARSER}.bin"
+
+
+def salvar_grafo_binario(grafo: Graph, filepath: str):
+    nomes = grafo.nodes()
+    ids = {nome: i for i, nome in enumerate(nomes)}
+    arestas = grafo.edges()
+
+    origens = array("i", (ids[u] for u, _, _ in arestas))
+    destinos = array("i", (ids[v] for _, v, _ in arestas))
+    pesos = array("d", (p for _, _, p in arestas))
+    tabela = "\0".join(nomes).encode("utf-8")
+
+    cabecalho = CABECALHO.pack(MAGICO, VERSAO_FORMATO, len(nomes), len(arestas), len(tabela))
+    preenchimento = _alinhar(CABECALHO.size + len(tabela)) - CABECALHO.size - len(tabela)
+
+    temporario = f"{filepath}.{os.getpid()}.tmp"
+    with open(temporario, "wb") as f:
+        f.write(cabecalho)
+        f.write(tabela)
+        f.write(b"\0" * preenchimento)
+        f.write(origens.tobytes())
+        f.write(destinos.tobytes())
+        f.write(pesos.tobytes())
+    os.replace(temporario, filepath)
+
+
+def ler_grafo_binario(filepath: str) -> Graph:
+    with open(filepath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        magico, versao, n_nos, n_arestas, n_tabela = CABECALHO.unpack_from(mm, 0)
+        if magico != MAGICO or versao != VERSAO_FORMATO:
+            raise ValueError(f"Cache de grafo inválido: {filepath}")
+
+        inicio = CABECALHO.size
+        tabela = mm[inicio:inicio + n_tabela].decode("utf-8")
+        nomes = tabela.split("\0") if n_nos else []
+
+        inicio = _alinhar(inicio + n_tabela)
+        meio = inicio + 4 * n_arestas
+        inicio_pesos = meio + 4 * n_arestas
+        fim = inicio_pesos + 8 * n_arestas
+        if len(nomes) != n_nos or len(mm) < fim:
+            raise ValueError(f"Cache de grafo truncado: {filepath}")
+
+        with memoryview(mm) as visao, \
+                visao[inicio:meio].cast("i") as origens, \
+                visao[meio:inicio_pesos].cast("i") as destinos, \
+                visao[inicio_pesos:fim].cast("d") as pesos:
+            grafo = Graph()
+            for nome in nomes:
+                grafo.add_node(nome)
+            grafo.add_edges(
+                (nomes[u], nomes[v], p) for u, v, p in zip(origens, destinos, pesos)
+            )
+
+    return grafo
+
+
+def carregar_grafo_em_cache(filepath_csv, tipo, construtor, cache_dir="out/cache"):
+    caminho = caminho_cache(filepath_csv, tipo, cache_dir)
+
+    if os.path.exists(caminho):
+        try:
+            return ler_grafo_binario(caminho)
+        except (ValueError, struct.error, OSError):
+            pass
+
+    grafo = construtor(filepath_csv)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    prefixo = _prefixo_cache(filepath_csv, tipo, cache_dir)
+    for antigo in glob.glob(f"{glob.escape(prefixo)}-*.bin"):
+        if antigo != caminho:
+            try:
+                os.remove(antigo)
+            except FileNotFoundError:
+                pass
+    salvar_grafo_binario(grafo, caminho)
+
+    return grafo
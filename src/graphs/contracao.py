@@ -0,0 +1,262 @@
+import json
+from heapq import heapify, heappush, heappop
+
+from src.graphs.algorithms import caminho_minimo, grafo_reverso
+
+VERSAO_HIERARQUIA = 1
+LIMITE_TESTEMUNHA = 100
+LIMITE_ORIGENS_EM_CACHE = 512
+
+
+class HierarquiaContracao:
+    def __init__(self, nomes, nivel, arestas, fonte_hash=None):
+        self.nomes = nomes
+        self.ids = {nome: i for i, nome in enumerate(nomes)}
+        self.nivel = nivel
+        self.arestas = arestas
+        self.fonte_hash = fonte_hash
+
+        self.cima = [[] for _ in nomes]
+        self.baixo = [[] for _ in nomes]
+        self.entrada = [[] for _ in nomes]
+        for (a, b), (peso, meio) in arestas.items():
+            if nivel[b] > nivel[a]:
+                self.cima[a].append((b, peso))
+            else:
+                self.baixo[b].append((a, peso))
+            if meio is None:
+                self.entrada[b].append((a, peso))
+
+        self.candidatos = [
+            sorted(entrada, key=lambda aresta: (-aresta[1], nomes[aresta[0]]))
+            for entrada in self.entrada
+        ]
+        self.entrada_zero = [any(peso == 0 for _, peso in entrada) for entrada in self.entrada]
+
+        pesos = [peso for entrada in self.entrada for _, peso in entrada]
+        escala = max((peso.as_integer_ratio()[1] for peso in pesos), default=1)
+        self.somas_exatas = len(nomes) * sum(pesos) * escala < 2 ** 53
+        self._original = None
+        self._subidas = {}
+        self._descidas = {}
+        self._distancias = {}
+
+    @classmethod
+    def construir(cls, grafo, fonte_hash=None, limite_testemunha=LIMITE_TESTEMUNHA):
+        nomes = list(grafo_reverso(grafo))
+        ids = {nome: i for i, nome in enumerate(nomes)}
+        n = len(nomes)
+        inf = float("inf")
+
+        saida = [{} for _ in range(n)]
+        entrada = [{} for _ in range(n)]
+        arestas = {}
+
+        for u in grafo:
+            for v, peso in grafo[u]:
+                if peso < 0:
+                    raise ValueError("A hierarquia de contração não suporta pesos negativos")
+                a, b = ids[u], ids[v]
+                if a != b and peso < saida[a].get(b, inf):
+                    saida[a][b] = peso
+                    entrada[b][a] = peso
+                    arestas[(a, b)] = (peso, None)
+
+        def testemunhas(origem, ignorado, limite):
+            distancias = {origem: 0.0}
+            heap = [(0.0, origem)]
+            fixados = 0
+
+            while heap:
+                distancia, x = heappop(heap)
+                if distancia > distancias[x]:
+                    continue
+                fixados += 1
+                if distancia > limite or fixados > limite_testemunha:
+                    break
+
+                for y, peso in saida[x].items():
+                    if y == ignorado:
+                        continue
+                    nova_distancia = distancia + peso
+                    if nova_distancia < distancias.get(y, inf):
+                        distancias[y] = nova_distancia
+                        heappush(heap, (nova_distancia, y))
+
+            return distancias
+
+        def avaliar(v):
+            atalhos = []
+            maior_saida = max(saida[v].values(), default=0.0)
+
+            for u, peso_uv in entrada[v].items():
+                distancias = testemunhas(u, v, peso_uv + maior_saida)
+                for w, peso_vw in saida[v].items():
+                    custo = peso_uv + peso_vw
+                    if w != u and distancias.get(w, inf) > custo:
+                        atalhos.append((u, w, custo))
+
+            prioridade = len(atalhos) - len(entrada[v]) - len(saida[v]) + contraidos_vizinhos[v]
+            return prioridade, atalhos
+
+        contraidos_vizinhos = [0] * n
+        nivel = [0] * n
+        heap = [(avaliar(v)[0], v) for v in range(n)]
+        heapify(heap)
+
+        for ordem in range(n):
+            while True:
+                _, v = heappop(heap)
+                prioridade, atalhos = avaliar(v)
+                if not heap or prioridade <= heap[0][0]:
+                    break
+                heappush(heap, (prioridade, v))
+
+            nivel[v] = ordem
+            for u, w, custo in atalhos:
+                if custo < saida[u].get(w, inf):
+                    saida[u][w] = custo
+                    entrada[w][u] = custo
+                    arestas[(u, w)] = (custo, v)
+
+            for u in entrada[v]:
+                del saida[u][v]
+                contraidos_vizinhos[u] += 1
+            for w in saida[v]:
+                del entrada[w][v]
+                contraidos_vizinhos[w] += 1
+
+        return cls(nomes, nivel, arestas, fonte_hash)
+
+    def _espaco(self, no, espacos, adjacencias):
+        espaco = espacos.get(no)
+        if espaco is not None:
+            return espaco
+
+        inf = float("inf")
+        espaco = {no: 0.0}
+        heap = [(0.0, no)]
+        while heap:
+            distancia_atual, u = heappop(heap)
+            if distancia_atual > espaco[u]:
+                continue
+            for v, peso in adjacencias[u]:
+                nova_distancia = distancia_atual + peso
+                if nova_distancia < espaco.get(v, inf):
+                    espaco[v] = nova_distancia
+                    heappush(heap, (nova_distancia, v))
+
+        espacos[no] = espaco
+        return espaco
+
+    def _distancia(self, subida, no):
+        descida = self._espaco(no, self._descidas, self.baixo)
+        if len(descida) > len(subida):
+            subida, descida = descida, subida
+
+        melhor = float("inf")
+        for x, distancia in subida.items():
+            outra = descida.get(x)
+            if outra is not None and distancia + outra < melhor:
+                melhor = distancia + outra
+        return melhor
+
+    def consultar(self, origem, destino):
+        o = self.ids.get(origem)
+        d = self.ids.get(destino)
+        if o is None or d is None:
+            return float("inf"), []
+        if not self.somas_exatas:
+            return caminho_minimo(self._grafo_original(), origem, destino)
+
+        distancias = self._distancias.get(o)
+        if distancias is None:
+            if len(self._distancias) >= LIMITE_ORIGENS_EM_CACHE:
+                antiga = next(iter(self._distancias))
+                del self._distancias[antiga]
+                self._subidas.pop(antiga, None)
+            distancias = self._distancias[o] = {}
+
+        subida = self._espaco(o, self._subidas, self.cima)
+        if d not in distancias:
+            distancias[d] = self._distancia(subida, d)
+        if distancias[d] == float("inf"):
+            return float("inf"), []
+
+        # O Dijkstra fixa os nós em ordem de (distância, nome), então o anterior de
+        # v é o primeiro vizinho de entrada "justo" nessa ordem. As distâncias dos
+        # candidatos saem de consultas pontuais à hierarquia e só são comparadas
+        # sem tolerância porque as somas de pesos são exatas. Com arestas de peso
+        # zero essa ordem não vale, e a rota é refeita pelo Dijkstra no grafo
+        # original.
+        ids = [d]
+        pesos = []
+        atual = d
+        while atual != o:
+            distancia_atual = distancias[atual]
+            escolhido = None
+            for u, peso in self.candidatos[atual]:
+                alvo = distancia_atual - peso
+                if alvo < 0:
+                    continue
+                distancia_u = distancias.get(u)
+                if distancia_u is None:
+                    distancia_u = distancias[u] = self._distancia(subida, u)
+                if distancia_u == alvo:
+                    escolhido = u
+                    break
+
+            if (
+                escolhido is None
+                or peso == 0
+                or not distancias[escolhido] < distancia_atual
+                or (escolhido != o and self.entrada_zero[escolhido])
+            ):
+                return caminho_minimo(self._grafo_original(), origem, destino)
+
+            atual = escolhido
+            ids.append(atual)
+            pesos.append(peso)
+        ids.reverse()
+
+        custo = 0.0
+        for peso in reversed(pesos):
+            custo += peso
+
+        return custo, [self.nomes[i] for i in ids]
+
+    def _grafo_original(self):
+        if self._original is None:
+            self._original = {nome: [] for nome in self.nomes}
+            for b, entrada in enumerate(self.entrada):
+                for a, peso in entrada:
+                    self._original[self.nomes[a]].append((self.nomes[b], peso))
+        return self._original
+
+    def custo(self, origem, destino):
+        return self.consultar(origem, destino)[0]
+
+    def caminho(self, origem, destino):
+        return self.consultar(origem, destino)[1]
+
+    def salvar(self, filepath):
+        dado = {
+            "versao": VERSAO_HIERARQUIA,
+            "fonte_hash": self.fonte_hash,
+            "nomes": self.nomes,
+            "nivel": self.nivel,
+            "arestas": [[a, b, peso, meio] for (a, b), (peso, meio) in self.arestas.items()],
+        }
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(dado, f, ensure_ascii=False)
+
+    @classmethod
+    def carregar(cls, filepath):
+        with open(filepath, encoding="utf-8") as f:
+            dado = json.load(f)
+
+        if dado.get("versao") != VERSAO_HIERARQUIA:
+            return None
+
+        arestas = {(a, b): (peso, meio) for a, b, peso, meio in dado["arestas"]}
+        return cls(dado["nomes"], dado["nivel"], arestas, dado.get("fonte_hash"))
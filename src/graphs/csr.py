@@ -0,0 +1,123 @@
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class CSRGraph:
+    def __init__(self, nomes, offsets, alvos, pesos, directed=False):
+        self.nomes = nomes
+        self.ids = {nome: i for i, nome in enumerate(nomes)}
+        self.offsets = offsets
+        self.alvos = alvos
+        self.pesos = pesos
+        self.directed = directed
+
+    @classmethod
+    def from_adjacency(cls, adj, directed=True):
+        ids = {}
+        nomes = []
+
+        def intern(nome):
+            idx = ids.get(nome)
+            if idx is None:
+                idx = len(nomes)
+                ids[nome] = idx
+                nomes.append(nome)
+            return idx
+
+        for no in adj:
+            intern(no)
+
+        offsets = array("q", [0])
+        alvos = array("i")
+        pesos = array("d")
+
+        for no in list(nomes):
+            for item in adj.get(no, []):
+                if isinstance(item, tuple):
+                    viz, peso = item
+                else:
+                    viz, peso = item, 1.0
+                alvos.append(intern(viz))
+                pesos.append(peso)
+            offsets.append(len(alvos))
+
+        while len(offsets) < len(nomes) + 1:
+            offsets.append(len(alvos))
+
+        return cls(nomes, offsets, alvos, pesos, directed=directed)
+
+    def node_id(self, node):
+        return self.ids[node]
+
+    def neighbor_ids(self, idx):
+        inicio = self.offsets[idx]
+        fim = self.offsets[idx + 1]
+        return self.alvos[inicio:fim], self.pesos[inicio:fim]
+
+    def _iter_neighbors(self, idx):
+        alvos, pesos = self.neighbor_ids(idx)
+        nomes = self.nomes
+        return zip([nomes[a] for a in alvos], pesos)
+
+    def neighbors(self, node):
+        idx = self.ids.get(node)
+        if idx is None:
+            return []
+        return list(self._iter_neighbors(idx))
+
+    def nodes(self):
+        return list(self.nomes)
+
+    def edges(self):
+        nomes = self.nomes
+        offsets = self.offsets
+        alvos = self.alvos
+        pesos = self.pesos
+        e = []
+
+        for u in range(len(nomes)):
+            for k in range(offsets[u], offsets[u + 1]):
+                v = alvos[k]
+                if self.directed or u <= v:
+                    e.append((nomes[u], nomes[v], pesos[k]))
+        return e
+
+    def degree(self, node):
+        idx = self.ids.get(node)
+        if idx is None:
+            return 0
+        return self.offsets[idx + 1] - self.offsets[idx]
+
+    def to_numpy(self):
+        if np is None:
+            raise ImportError("numpy não está instalado")
+        return (
+            np.frombuffer(self.offsets, dtype=np.int64),
+            np.frombuffer(self.alvos, dtype=np.int32),
+            np.frombuffer(self.pesos, dtype=np.float64),
+        )
+
+    def nbytes(self):
+        return sum(a.itemsize * len(a) for a in (self.offsets, self.alvos, self.pesos))
+
+    def __len__(self):
+        return len(self.nomes)
+
+    def __iter__(self):
+        return iter(self.nomes)
+
+    def __contains__(self, node):
+        return node in self.ids
+
+    def __getitem__(self, node):
+        return self._iter_neighbors(self.ids[node])
+
+    def get(self, node, default=None):
+        idx = self.ids.get(node)
+        if idx is None:
+            return default
+        return self._iter_neighbors(idx)
@@ -0,0 +1,250 @@
+from heapq import heappush, heappop
+
+
+def _novos_contadores():
+    return {"insercoes": 0, "diminuicoes": 0, "extracoes": 0, "extracoes_obsoletas": 0}
+
+
+class FilaPreguicosa:
+    def __init__(self):
+        self._heap = []
+        self._melhor = {}
+        self.contadores = _novos_contadores()
+
+    def __len__(self):
+        return len(self._melhor)
+
+    def __contains__(self, item):
+        return item in self._melhor
+
+    def inserir_ou_diminuir(self, item, prioridade):
+        atual = self._melhor.get(item)
+        if atual is not None and atual <= prioridade:
+            return False
+
+        self.contadores["diminuicoes" if atual is not None else "insercoes"] += 1
+        self._melhor[item] = prioridade
+        heappush(self._heap, (prioridade, item))
+        return True
+
+    def extrair(self):
+        while True:
+            prioridade, item = heappop(self._heap)
+            self.contadores["extracoes"] += 1
+            if self._melhor.get(item) == prioridade:
+                del self._melhor[item]
+                return prioridade, item
+            self.contadores["extracoes_obsoletas"] += 1
+
+
+class HeapIndexado:
+    def __init__(self, aridade=2):
+        if aridade < 2:
+            raise ValueError("A aridade do heap deve ser pelo menos 2")
+        self.aridade = aridade
+        self._itens = []
+        self._prioridades = []
+        self._posicao = {}
+        self.contadores = _novos_contadores()
+
+    def __len__(self):
+        return len(self._itens)
+
+    def __contains__(self, item):
+        return item in self._posicao
+
+    def inserir_ou_diminuir(self, item, prioridade):
+        pos = self._posicao.get(item)
+
+        if pos is None:
+            pos = len(self._itens)
+            self._itens.append(item)
+            self._prioridades.append(prioridade)
+            self._posicao[item] = pos
+            self.contadores["insercoes"] += 1
+        elif prioridade < self._prioridades[pos]:
+            self._prioridades[pos] = prioridade
+            self.contadores["diminuicoes"] += 1
+        else:
+            return False
+
+        self._subir(pos)
+        return True
+
+    def extrair(self):
+        itens = self._itens
+        prioridades = self._prioridades
+        item = itens[0]
+        prioridade = prioridades[0]
+
+        ultimo = itens.pop()
+        ultima_prioridade = prioridades.pop()
+        del self._posicao[item]
+
+        if itens:
+            itens[0] = ultimo
+            prioridades[0] = ultima_prioridade
+            self._posicao[ultimo] = 0
+            self._descer(0)
+
+        self.contadores["extracoes"] += 1
+        return prioridade, item
+
+    def _subir(self, pos):
+        itens = self._itens
+        prioridades = self._prioridades
+        posicao = self._posicao
+        item = itens[pos]
+        prioridade = prioridades[pos]
+
+        while pos > 0:
+            pai = (pos - 1) // self.aridade
+            if prioridades[pai] <= prioridade:
+                break
+            itens[pos] = itens[pai]
+            prioridades[pos] = prioridades[pai]
+            posicao[itens[pos]] = pos
+            pos = pai
+
+        itens[pos] = item
+        prioridades[pos] = prioridade
+        posicao[item] = pos
+
+    def _descer(self, pos):
+        itens = self._itens
+        prioridades = self._prioridades
+        posicao = self._posicao
+        aridade = self.aridade
+        n = len(itens)
+        item = itens[pos]
+        prioridade = prioridades[pos]
+
+        while True:
+            primeiro = aridade * pos + 1
+            if primeiro >= n:
+                break
+
+            menor = primeiro
+            menor_prioridade = prioridades[primeiro]
+            for filho in range(primeiro + 1, min(primeiro + aridade, n)):
+                if prioridades[filho] < menor_prioridade:
+                    menor = filho
+                    menor_prioridade = prioridades[filho]
+
+            if menor_prioridade >= prioridade:
+                break
+
+            itens[pos] = itens[menor]
+            prioridades[pos] = menor_prioridade
+            posicao[itens[pos]] = pos
+            pos = menor
+
+        itens[pos] = item
+        prioridades[pos] = prioridade
+        posicao[item] = pos
+
+
+class _NoPareamento:
+    __slots__ = ("item", "prioridade", "filho", "irmao", "anterior")
+
+    def __init__(self, item, prioridade):
+        self.item = item
+        self.prioridade = prioridade
+        self.filho = None
+        self.irmao = None
+        self.anterior = None
+
+
+class HeapPareamento:
+    def __init__(self):
+        self._raiz = None
+        self._nos = {}
+        self.contadores = _novos_contadores()
+
+    def __len__(self):
+        return len(self._nos)
+
+    def __contains__(self, item):
+        return item in self._nos
+
+    def inserir_ou_diminuir(self, item, prioridade):
+        no = self._nos.get(item)
+
+        if no is None:
+            no = _NoPareamento(item, prioridade)
+            self._nos[item] = no
+            self._raiz = self._unir(self._raiz, no)
+            self.contadores["insercoes"] += 1
+            return True
+
+        if prioridade >= no.prioridade:
+            return False
+
+        no.prioridade = prioridade
+        self.contadores["diminuicoes"] += 1
+        if no is not self._raiz:
+            self._cortar(no)
+            self._raiz = self._unir(self._raiz, no)
+        return True
+
+    def extrair(self):
+        raiz = self._raiz
+        del self._nos[raiz.item]
+
+        filhos = []
+        filho = raiz.filho
+        while filho is not None:
+            proximo = filho.irmao
+            filho.irmao = filho.anterior = None
+            filhos.append(filho)
+            filho = proximo
+
+        pares = [
+            self._unir(filhos[i], filhos[i + 1] if i + 1 < len(filhos) else None)
+            for i in range(0, len(filhos), 2)
+        ]
+        nova_raiz = None
+        for arvore in reversed(pares):
+            nova_raiz = self._unir(arvore, nova_raiz)
+
+        self._raiz = nova_raiz
+        self.contadores["extracoes"] += 1
+        return raiz.prioridade, raiz.item
+
+    def _cortar(self, no):
+        if no.anterior.filho is no:
+            no.anterior.filho = no.irmao
+        else:
+            no.anterior.irmao = no.irmao
+        if no.irmao is not None:
+            no.irmao.anterior = no.anterior
+        no.irmao = no.anterior = None
+
+    def _unir(self, a, b):
+        if a is None:
+            return b
+        if b is None:
+            return a
+        if b.prioridade < a.prioridade:
+            a, b = b, a
+
+        b.anterior = a
+        b.irmao = a.filho
+        if a.filho is not None:
+            a.filho.anterior = b
+        a.filho = b
+        return a
+
+
+FILAS = {
+    "heapq": FilaPreguicosa,
+    "binario": lambda: HeapIndexado(2),
+    "4-ario": lambda: HeapIndexado(4),
+    "pareamento": HeapPareamento,
+}
+
+
+def criar_fila(nome):
+    if nome not in FILAS:
+        raise ValueError(f"Fila de prioridade desconhecida: {nome}")
+    return FILAS[nome]()
@@ -1,34 +1,105 @@
+from src.graphs.csr import CSRGraph
+
+
 class Graph:
     def __init__(self):
         self.adj = {}
+        self._vizinhos = {}
+        self._arestas = []
+        self._arestas_fixas = None
+        self._soma_graus = 0
 
     def add_node(self, node):
         if node not in self.adj:
             self.adj[node] = []
+            self._vizinhos[node] = set()
 
     def add_edge(self, u, v, peso):
         self.add_node(u)
         self.add_node(v)
 
-        if not any(nei == v for nei, _ in self.adj[u]):
+        nova = False
+
+        vizinhos_u = self._vizinhos[u]
+        if v not in vizinhos_u:
+            vizinhos_u.add(v)
             self.adj[u].append((v, peso))
+            self._soma_graus += 1
+            nova = True
 
-        if not any(nei == u for nei, _ in self.adj[v]):
+        vizinhos_v = self._vizinhos[v]
+        if u not in vizinhos_v:
+            vizinhos_v.add(u)
             self.adj[v].append((u, peso))
+            self._soma_graus += 1
+            nova = True
+
+        if nova:
+            self._arestas_fixas = None
+            if self._arestas is not None:
+                self._arestas.append((u, v, peso))
+
+    def add_edges(self, arestas):
+        for u, v, peso in arestas:
+            self.add_edge(u, v, peso)
+
+    def remove_edge(self, u, v):
+        for a, b in ((u, v), (v, u)):
+            vizinhos = self._vizinhos.get(a)
+            if vizinhos is None or b not in vizinhos:
+                continue
+            vizinhos.discard(b)
+            self.adj[a] = [(nei, p) for nei, p in self.adj[a] if nei != b]
+            self._soma_graus -= 1
+
+        self._arestas = None
+        self._arestas_fixas = None
+
+    def has_edge(self, u, v):
+        return v in self._vizinhos.get(u, ())
 
     def neighbors(self, node):
         return self.adj.get(node, [])
 
+    def neighbor_set(self, node):
+        return self._vizinhos.get(node, set())
+
     def nodes(self):
         return list(self.adj.keys())
 
+    def _lista_arestas(self):
+        if self._arestas is None:
+            vistos = set()
+            self._arestas = []
+            for u in self.adj:
+                for v, p in self.adj[u]:
+                    if (v, u) not in vistos:
+                        vistos.add((u, v))
+                        self._arestas.append((u, v, p))
+        return self._arestas
+
     def edges(self):
-        e = set()
-        for u in self.adj:
-            for v, p in self.adj[u]:
-                if (v, u, p) not in e:
-                    e.add((u, v, p))
-        return list(e)
+        if self._arestas_fixas is None:
+            self._arestas_fixas = tuple(self._lista_arestas())
+        return self._arestas_fixas
 
     def degree(self, node):
         return len(self.adj.get(node, []))
+
+    def degree_sum(self):
+        return self._soma_graus
+
+    def ordem(self):
+        return len(self.adj)
+
+    def tamanho(self):
+        return len(self._lista_arestas())
+
+    def densidade(self):
+        n = len(self.adj)
+        if n <= 1:
+            return 0.0
+        return (2 * self.tamanho()) / (n * (n - 1))
+
+    def compile(self):
+        return CSRGraph.from_adjacency(self.adj, directed=False)
@@ -0,0 +1,97 @@
+import json
+from array import array
+
+from src.graphs.algorithms import grafo_reverso, motor_caminhos
+
+VERSAO_INDICE = 1
+
+
+class IndiceCaminhos:
+    def __init__(self, nomes, distancias, anteriores, fonte_hash=None):
+        self.nomes = nomes
+        self.ids = {nome: i for i, nome in enumerate(nomes)}
+        self.distancias = distancias
+        self.anteriores = anteriores
+        self.fonte_hash = fonte_hash
+
+    @classmethod
+    def construir(cls, grafo, fonte_hash=None):
+        nomes = list(grafo_reverso(grafo))
+        ids = {nome: i for i, nome in enumerate(nomes)}
+        n = len(nomes)
+        inf = float("inf")
+        adj = {no: grafo.get(no, []) for no in nomes}
+
+        distancias = array("d", [inf]) * (n * n)
+        anteriores = array("i", [-1]) * (n * n)
+        caminhos = motor_caminhos(adj)
+
+        for o, origem in enumerate(nomes):
+            dist_de, ant_de = caminhos(adj, origem, predecessores=True)
+            linha = o * n
+
+            for no, custo in dist_de.items():
+                if custo == inf:
+                    continue
+                d = ids[no]
+                distancias[linha + d] = custo
+                if no != origem:
+                    anteriores[linha + d] = ids[ant_de[no]]
+
+        return cls(nomes, distancias, anteriores, fonte_hash)
+
+    def custo(self, origem, destino):
+        o = self.ids.get(origem)
+        d = self.ids.get(destino)
+        if o is None or d is None:
+            return float("inf")
+        return self.distancias[o * len(self.nomes) + d]
+
+    def caminho(self, origem, destino):
+        o = self.ids.get(origem)
+        d = self.ids.get(destino)
+        if o is None or d is None:
+            return []
+
+        n = len(self.nomes)
+        if self.distancias[o * n + d] == float("inf"):
+            return []
+
+        linha = o * n
+        caminho = [destino]
+        atual = d
+        while atual != o:
+            atual = self.anteriores[linha + atual]
+            caminho.append(self.nomes[atual])
+        caminho.reverse()
+
+        return caminho
+
+    def consultar(self, origem, destino):
+        return self.custo(origem, destino), self.caminho(origem, destino)
+
+    def salvar(self, filepath):
+        dado = {
+            "versao": VERSAO_INDICE,
+            "fonte_hash": self.fonte_hash,
+            "nomes": self.nomes,
+            "distancias": self.distancias.tolist(),
+            "anteriores": self.anteriores.tolist(),
+        }
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(dado, f, ensure_ascii=False)
+
+    @classmethod
+    def carregar(cls, filepath):
+        with open(filepath, encoding="utf-8") as f:
+            dado = json.load(f)
+
+        if dado.get("versao") != VERSAO_INDICE:
+            return None
+
+        return cls(
+            dado["nomes"],
+            array("d", dado["distancias"]),
+            array("i", dado["anteriores"]),
+            dado.get("fonte_hash"),
+        )
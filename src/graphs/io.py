@@ -1,6 +1,12 @@
+import collections
 import csv
-import re
-from typing import List, Tuple
+import hashlib
+from typing import Iterator, List, Tuple
+
+from src.graphs.multigrafo import MultiDiGraph
+
+VERSAO_PARSER = 2
+ASPAS = '"“”'
 
 def load_bairros_csv(filepath: str) -> Tuple[List[str], List[List[str]]]:
     with open(filepath, encoding='utf-8') as f:
@@ -36,37 +42,121 @@ def save_csv(filepath: str, data: List[List[str]], header: List[str] = None):
         writer.writerows(data)
 
 
+def hash_arquivo(filepath: str) -> str:
+    h = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for bloco in iter(lambda: f.read(1 << 20), b''):
+            h.update(bloco)
+    return h.hexdigest()
+
+
 def validate_bairros(bairros: List[str]) -> bool:
     return len(bairros) == len(set(bairros)) and all(bairros)
 
-def load_adjacencias(filepath: str):
-    adj = []
-    with open(filepath, encoding='utf-8') as f:
-        for raw_line in f:
-            line = raw_line.strip()
-            if not line:
-                continue
-
-            nums = re.findall(r'[-+]?\d*\.?\d+', line)
-            if not nums:
+def iter_adjacencias(filepath: str) -> Iterator[Tuple[str, str, str, str, float]]:
+    with open(filepath, encoding='utf-8', newline='') as f:
+        reader = csv.reader(f, skipinitialspace=True)
 
+        for row in reader:
+            if len(row) < 3:
                 continue
-            peso = float(nums[-1])
 
-            peso_str = nums[-1]
-            idx = line.rfind(peso_str)
-            base = line[:idx].rstrip().rstrip(',')
+            try:
+                peso = float(row[-1])
+            except ValueError:
+                continue
 
-            parts = base.split(',')
-            if len(parts) < 2:
+            origem = row[0].strip()
+            destino = row[1].strip()
+            if not origem or not destino:
                 continue
 
-            origem = parts[0].strip()
-            destino = parts[1].strip()
-            descricao = ",".join(parts[2:]).strip() if len(parts) > 2 else ""
-            logradouro = descricao
-            observacao = ""
+            meio = [campo.strip() for campo in row[2:-1]]
+            logradouro = meio[0] if meio else ""
+            observacao = ", ".join(meio[1:]).strip(ASPAS).strip()
+
+            yield origem, destino, logradouro, observacao, peso
+
+
+def load_adjacencias(filepath: str) -> List[Tuple[str, str, str, str, float]]:
+    return list(iter_adjacencias(filepath))
+
+
+class DatasetVoos:
+    def __init__(self, voos: List[Tuple[str, str, str, float]]):
+        self.voos = voos
+        self.nos: List[str] = []
+        self.contagem_arestas = {}
+        self.graus_saida = {}
+        self.pesos = set()
+        self._multigrafo = None
+
+        vistos = set()
+        for origem, destino, classe, peso in voos:
+            for no in (origem, destino):
+                if no not in vistos:
+                    vistos.add(no)
+                    self.nos.append(no)
+            chave = (origem, destino)
+            self.contagem_arestas[chave] = self.contagem_arestas.get(chave, 0) + 1
+            self.graus_saida[origem] = self.graus_saida.get(origem, 0) + 1
+            self.pesos.add(peso)
+
+    @staticmethod
+    def peso_assinado(classe: str, peso: float) -> float:
+        if classe == "economica":
+            return -abs(peso)
+        return abs(peso)
+
+    def multigrafo(self) -> MultiDiGraph:
+        if self._multigrafo is None:
+            self._multigrafo = MultiDiGraph()
+            for no in self.nos:
+                self._multigrafo.add_node(no)
+            self._multigrafo.add_edges(
+                (origem, destino, peso, classe) for origem, destino, classe, peso in self.voos
+            )
+        return self._multigrafo
+
+    def adjacencia(self, assinada: bool = False, colapsada: bool = False):
+        if colapsada:
+            peso = self.peso_assinado if assinada else (lambda _, p: abs(p))
+            return self.multigrafo().colapsar("min", peso=peso)
+
+        adj = {}
+        for origem, destino, classe, peso in self.voos:
+            if assinada:
+                peso = self.peso_assinado(classe, peso)
+            else:
+                peso = abs(peso)
+            adj.setdefault(origem, []).append((destino, peso))
+
+        for no in self.nos:
+            adj.setdefault(no, [])
+
+        return adj
+
+    def estatisticas_graus(self) -> dict:
+        graus_lista = list(self.graus_saida.values())
+        return {
+            "grau_min": min(graus_lista) if graus_lista else 0,
+            "grau_max": max(graus_lista) if graus_lista else 0,
+            "grau_medio": sum(graus_lista)/len(graus_lista) if graus_lista else 0,
+            "distribuicao_graus": dict(collections.Counter(graus_lista)),
+        }
+
+
+def load_voos(filepath: str) -> DatasetVoos:
+    voos = []
+    with open(filepath, encoding='utf-8') as f:
+        reader = csv.DictReader(f, skipinitialspace=True)
 
-            adj.append((origem, destino, logradouro, observacao, peso))
+        for row in reader:
+            voos.append((
+                row["Origem"].strip(),
+                row["Destino"].strip(),
+                row["Classe"].strip().lower(),
+                float(row["Peso"]),
+            ))
 
-    return adj
\ No newline at end of file
+    return DatasetVoos(voos)
@@ -0,0 +1,84 @@
+import multiprocessing
+
+from src.graphs.algorithms import bfs, dfs_completo, bellman_ford_fila, motor_caminhos
+
+_GRAFO = None
+_CAMINHOS = None
+
+
+def _inicializar(grafo, algoritmo=None):
+    global _GRAFO, _CAMINHOS
+    _GRAFO = grafo
+    _CAMINHOS = motor_caminhos(grafo) if grafo is not None and algoritmo == "dijkstra" else None
+
+
+def agrupar_por_origem(consultas):
+    grupos = {}
+
+    for origem, destino in consultas:
+        destinos = grupos.setdefault(origem, [])
+        if destino is None:
+            grupos[origem] = None
+        elif destinos is not None:
+            destinos.append(destino)
+
+    return grupos
+
+
+def _valores_por_origem(grafo, algoritmo, origem):
+    if algoritmo == "bfs":
+        _, camadas = bfs(grafo, origem)
+        return camadas
+    if algoritmo == "dfs":
+        return {no: True for no in dfs_completo(grafo, [origem])["ordem"]}
+    if algoritmo == "dijkstra":
+        return _CAMINHOS(grafo, origem)
+    if algoritmo == "bellman_ford":
+        return bellman_ford_fila(grafo, origem)["distancias"]
+    raise ValueError(f"Algoritmo desconhecido: {algoritmo}")
+
+
+def _padrao(algoritmo):
+    if algoritmo == "bfs":
+        return None
+    if algoritmo == "dfs":
+        return False
+    return float("inf")
+
+
+def _responder(tarefa):
+    algoritmo, origem, destinos = tarefa
+    valores = _valores_por_origem(_GRAFO, algoritmo, origem)
+
+    if destinos is None:
+        return origem, valores
+
+    padrao = _padrao(algoritmo)
+    return origem, {destino: valores.get(destino, padrao) for destino in destinos}
+
+
+def consultar_lote(grafo, consultas, algoritmo="dijkstra", processos=1):
+    grupos = agrupar_por_origem(consultas)
+    tarefas = [(algoritmo, origem, destinos) for origem, destinos in grupos.items()]
+
+    if processos <= 1 or len(tarefas) <= 1:
+        _inicializar(grafo, algoritmo)
+        try:
+            return dict(_responder(tarefa) for tarefa in tarefas)
+        finally:
+            _inicializar(None)
+
+    metodos = multiprocessing.get_all_start_methods()
+    contexto = multiprocessing.get_context("fork" if "fork" in metodos else None)
+    bloco = max(1, len(tarefas) // (processos * 4))
+
+    if contexto.get_start_method() == "fork":
+        _inicializar(grafo, algoritmo)
+        try:
+            with contexto.Pool(processos) as pool:
+                return dict(pool.imap_unordered(_responder, tarefas, bloco))
+        finally:
+            _inicializar(None)
+
+    with contexto.Pool(processos, initializer=_inicializar, initargs=(grafo, algoritmo)) as pool:
+        return dict(pool.imap_unordered(_responder, tarefas, bloco))
@@ -0,0 +1,75 @@
+MODOS_COLAPSO = ("min", "max", "contagem")
+
+
+class MultiDiGraph:
+    def __init__(self):
+        self.feixes = {}
+        self._tamanho = 0
+
+    def add_node(self, node):
+        if node not in self.feixes:
+            self.feixes[node] = {}
+
+    def add_edge(self, u, v, peso, classe=None):
+        self.add_node(u)
+        self.add_node(v)
+        self.feixes[u].setdefault(v, []).append((classe, peso))
+        self._tamanho += 1
+
+    def add_edges(self, arestas):
+        for u, v, peso, classe in arestas:
+            self.add_edge(u, v, peso, classe)
+
+    def nodes(self):
+        return list(self.feixes.keys())
+
+    def ordem(self):
+        return len(self.feixes)
+
+    def tamanho(self):
+        return self._tamanho
+
+    def num_pares(self):
+        return sum(len(destinos) for destinos in self.feixes.values())
+
+    def feixe(self, u, v):
+        return self.feixes.get(u, {}).get(v, [])
+
+    def multiplicidade(self, u, v):
+        return len(self.feixe(u, v))
+
+    def neighbors(self, node):
+        return [
+            (v, peso)
+            for v, arestas in self.feixes.get(node, {}).items()
+            for _, peso in arestas
+        ]
+
+    def out_degree(self, node):
+        return sum(len(arestas) for arestas in self.feixes.get(node, {}).values())
+
+    def agregar(self, modo="min", por_classe=False, peso=None):
+        if modo not in MODOS_COLAPSO:
+            raise ValueError(f"Modo de colapso desconhecido: {modo}")
+
+        resumo = {}
+        for u, destinos in self.feixes.items():
+            for v, arestas in destinos.items():
+                for classe, p in arestas:
+                    chave = (u, v, classe) if por_classe else (u, v)
+                    if modo == "contagem":
+                        resumo[chave] = resumo.get(chave, 0) + 1
+                        continue
+
+                    valor = peso(classe, p) if peso is not None else p
+                    atual = resumo.get(chave)
+                    if atual is None or (valor < atual if modo == "min" else valor > atual):
+                        resumo[chave] = valor
+
+        return resumo
+
+    def colapsar(self, modo="min", peso=None):
+        adj = {node: [] for node in self.feixes}
+        for (u, v), valor in self.agregar(modo, peso=peso).items():
+            adj[u].append((v, valor))
+        return adj
@@ -0,0 +1,123 @@
+import cProfile
+import json
+import os
+import re
+import time
+import tracemalloc
+from contextlib import contextmanager
+from functools import wraps
+
+_ATIVO = None
+
+
+class Perfil:
+    def __init__(self, cprofile_dir=None):
+        self.registros = []
+        self.cprofile_dir = cprofile_dir
+        self._pilha = []
+
+    @contextmanager
+    def medir(self, nome):
+        registro = {
+            "nome": nome,
+            "inicio": time.time(),
+            "parede": 0.0,
+            "cpu": 0.0,
+            "pico_memoria_bytes": 0,
+            "contadores": {},
+            "filhos": [],
+        }
+        pai = self._pilha[-1] if self._pilha else None
+        (pai["filhos"] if pai else self.registros).append(registro)
+
+        iniciou_tracemalloc = not tracemalloc.is_tracing()
+        if iniciou_tracemalloc:
+            tracemalloc.start()
+        elif pai is not None:
+            pai["_pico"] = max(pai["_pico"], tracemalloc.get_traced_memory()[1])
+        registro["_base"] = tracemalloc.get_traced_memory()[0]
+        registro["_pico"] = 0
+        tracemalloc.reset_peak()
+
+        profiler = None
+        if self.cprofile_dir is not None and pai is None:
+            profiler = cProfile.Profile()
+            profiler.enable()
+
+        self._pilha.append(registro)
+        t0, c0 = time.perf_counter(), time.process_time()
+        try:
+            yield registro
+        finally:
+            registro["parede"] = time.perf_counter() - t0
+            registro["cpu"] = time.process_time() - c0
+            self._pilha.pop()
+
+            if profiler is not None:
+                profiler.disable()
+                os.makedirs(self.cprofile_dir, exist_ok=True)
+                arquivo = re.sub(r"[^\w.-]", "_", nome) + ".prof"
+                profiler.dump_stats(os.path.join(self.cprofile_dir, arquivo))
+
+            pico = max(registro.pop("_pico"), tracemalloc.get_traced_memory()[1])
+            registro["pico_memoria_bytes"] = max(0, pico - registro.pop("_base"))
+            if pai is not None:
+                pai["_pico"] = max(pai["_pico"], pico)
+            if iniciou_tracemalloc:
+                tracemalloc.stop()
+
+    def contar(self, grupo, **valores):
+        for registro in self._pilha:
+            contadores = registro["contadores"].setdefault(grupo, {})
+            for chave, valor in valores.items():
+                contadores[chave] = contadores.get(chave, 0) + valor
+
+    def salvar(self, filepath):
+        os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump({"registros": self.registros}, f, ensure_ascii=False, indent=2)
+
+
+def perfil_ativo():
+    return _ATIVO
+
+
+@contextmanager
+def ativar(perfil):
+    global _ATIVO
+    anterior = _ATIVO
+    _ATIVO = perfil
+    try:
+        yield perfil
+    finally:
+        _ATIVO = anterior
+
+
+@contextmanager
+def medir(nome):
+    if _ATIVO is None:
+        yield None
+        return
+    with _ATIVO.medir(nome) as registro:
+        yield registro
+
+
+def medido(nome=None):
+    def decorador(funcao):
+        rotulo = nome or funcao.__qualname__
+
+        @wraps(funcao)
+        def envolvida(*args, **kwargs):
+            if _ATIVO is None:
+                return funcao(*args, **kwargs)
+            with _ATIVO.medir(rotulo):
+                return funcao(*args, **kwargs)
+
+        return envolvida
+
+    return decorador
+
+
+def contar(grupo, **valores):
+    if _ATIVO is not None:
+        _ATIVO.contar(grupo, **valores)
@@ -1,60 +1,49 @@
-import csv
+import math
 import os
 import time
 import json
-import collections
-from collections import deque, defaultdict
 from src.graphs.graph import Graph
-from src.graphs.algorithms import bfs, dfs, dijkstra, bellman_ford
+from src.graphs.cache import carregar_grafo_em_cache
+from src.graphs.io import DatasetVoos, load_voos
+from src.graphs.algorithms import (
+    bfs,
+    dfs_completo,
+    dijkstra_bidirecional,
+    grafo_reverso,
+    bellman_ford_fila,
+    potenciais_parciais,
+    reponderar,
+    dijkstra_reponderado,
+    reconstruir_caminho,
+)
 from src.viz import plot_histograma_graus_voos
+from src.graphs.perfil import medido
 
-def carregar_grafo_voos(filepath):
-    grafo = Graph()
+def carregar_grafo_voos(filepath, cache_dir="out/cache"):
+    if cache_dir is None:
+        return _ler_grafo_voos(filepath)
 
-    with open(filepath, encoding="utf-8") as f:
-        reader = csv.DictReader(f, skipinitialspace=True)
+    return carregar_grafo_em_cache(filepath, "voos", _ler_grafo_voos, cache_dir)
 
-        for row in reader:
-            origem = row["Origem"].strip()
-            destino = row["Destino"].strip()
-            classe = row["Classe"].strip().lower()
-            peso = float(row["Peso"])
-            if classe == "economica":
-                peso = -abs(peso)
-            else:
-                peso = abs(peso)
-            grafo.add_edge(origem, destino, peso)
+def _ler_grafo_voos(filepath):
+    dataset = load_voos(filepath)
+    grafo = Graph()
+    grafo.add_edges(
+        (origem, destino, DatasetVoos.peso_assinado(classe, peso))
+        for origem, destino, classe, peso in dataset.voos
+    )
 
     return grafo
 
-def gerar_info_dataset_voos(filepath_csv, out_path):
-    vertices = set()
-    arestas = 0
-    graus = collections.defaultdict(int)
-    pesos = set()
-
-    with open(filepath_csv, encoding="utf-8") as f:
-        reader = csv.DictReader(f, skipinitialspace=True)
-
-        for row in reader:
-            origem = row["Origem"].strip()
-            destino = row["Destino"].strip()
-            peso = float(row["Peso"])
-            vertices.add(origem)
-            vertices.add(destino)
-            arestas += 1
-            graus[origem] += 1
-            pesos.add(peso)
-    graus_lista = list(graus.values())
+@medido()
+def gerar_info_dataset_voos(dataset, out_path):
     info = {
-        "num_vertices": len(vertices),
-        "num_arestas": arestas,
+        "num_vertices": len(dataset.nos),
+        "num_arestas": len(dataset.voos),
         "tipo": "dirigido, ponderado",
-        "grau_min": min(graus_lista) if graus_lista else 0,
-        "grau_max": max(graus_lista) if graus_lista else 0,
-        "grau_medio": sum(graus_lista)/len(graus_lista) if graus_lista else 0,
-        "distribuicao_graus": dict(collections.Counter(graus_lista)),
-        "exemplo_pesos": list(sorted(pesos))[:10],
+        "num_pares_distintos": dataset.multigrafo().num_pares(),
+        **dataset.estatisticas_graus(),
+        "exemplo_pesos": list(sorted(dataset.pesos))[:10],
     }
 
     with open(out_path, "w", encoding="utf-8") as f:
@@ -62,6 +51,7 @@ def gerar_info_dataset_voos(filepath_csv, out_path):
 
     print(f"Info do dataset salva em {out_path}")
 
+@medido()
 def rodar_bfs_graphs(grafo, fontes, out_dir):
     resultados = {}
     for fonte in fontes:
@@ -77,58 +67,88 @@ def rodar_bfs_graphs(grafo, fontes, out_dir):
         json.dump(resultados, f, ensure_ascii=False, indent=2)
     return resultados
 
+@medido()
 def rodar_dfs_graphs(grafo, fontes, out_dir):
     resultados = {}
     for fonte in fontes:
         t0 = time.time()
-        ordem_dfs, ciclos_dfs = dfs(grafo, fonte)
+        dfs_res = dfs_completo(grafo, [fonte])
         t1 = time.time()
+        arestas = dfs_res["arestas"]
         resultados[f"DFS_{fonte}"] = {
-            "ordem": ordem_dfs,
-            "ciclos": ciclos_dfs,
+            "ordem": dfs_res["ordem"],
+            "ciclos": arestas["retorno"],
+            "tem_ciclo": bool(arestas["retorno"]),
+            "descoberta": dfs_res["descoberta"],
+            "finalizacao": dfs_res["finalizacao"],
+            "arestas": arestas,
             "tempo": t1-t0
         }
     with open(os.path.join(out_dir, "dfs_resultados.json"), "w", encoding="utf-8") as f:
         json.dump(resultados, f, ensure_ascii=False, indent=2)
     return resultados
 
+@medido()
 def rodar_dijkstra_graphs(g, pares, out_dir):
     resultados = {}
+    reverso = grafo_reverso(g)
     for origem, destino in pares:
         t0 = time.time()
-        distancias = dijkstra(g, origem)
-        custo = distancias.get(destino, float('inf'))
+        custo, caminho = dijkstra_bidirecional(g, origem, destino, reverso)
         t1 = time.time()
         resultados[f"Dijkstra_{origem}_{destino}"] = {
             "custo": custo,
+            "caminho": caminho,
             "tempo": t1-t0
         }
     with open(os.path.join(out_dir, "dijkstra_resultados.json"), "w", encoding="utf-8") as f:
         json.dump(resultados, f, ensure_ascii=False, indent=2)
     return resultados
 
+@medido()
 def rodar_bellman_ford_graphs(grafo, casos, out_dir):
     resultados = {}
 
-    for origem, destino in casos:
+    t0 = time.time()
+    potenciais, ciclos = potenciais_parciais(grafo)
+    reponderado = reponderar(grafo, potenciais)
+    tempo_potenciais = time.time() - t0
+
+    por_origem = {}
+    for origem, _ in casos:
+        if origem in por_origem:
+            continue
         t0 = time.time()
-        ciclo_negativo = False
-        try:
-            distancias = bellman_ford(grafo, origem)
-            custo = distancias.get(destino, float('inf'))
-        except Exception as e:
+        resultado = dijkstra_reponderado(grafo, reponderado, potenciais, origem, ciclos)
+        metodo = "johnson"
+        if resultado is None:
+            resultado = bellman_ford_fila(grafo, origem)
+            metodo = "spfa"
+        por_origem[origem] = (resultado, metodo, time.time() - t0)
+
+    for origem, destino in casos:
+        resultado, metodo, tempo = por_origem[origem]
+        custo = resultado["distancias"].get(destino, float('inf'))
+        caminho = []
+        if math.isfinite(custo):
+            caminho = reconstruir_caminho(resultado["anteriores"], destino)
+        else:
             custo = None
-            ciclo_negativo = "ciclo negativo" in str(e).lower()
-        t1 = time.time()
         resultados[f"BellmanFord_{origem}_{destino}"] = {
             "custo": custo,
-            "ciclo_negativo": ciclo_negativo,
-            "tempo": t1-t0
+            "caminho": caminho,
+            "ciclo_negativo": bool(resultado["ciclos"]),
+            "ciclos": resultado["ciclos"],
+            "nos_infinito_negativo": sorted(resultado["infinito_negativo"]),
+            "metodo": metodo,
+            "tempo": tempo,
+            "tempo_potenciais": tempo_potenciais,
         }
     with open(os.path.join(out_dir, "bellman_ford_resultados.json"), "w", encoding="utf-8") as f:
         json.dump(resultados, f, ensure_ascii=False, indent=2)
     return resultados
 
+@medido()
 def gerar_parte2_report(bfs_res, dfs_res, dijkstra_res, bellman_res, out_dir):
     tabela = []
 
@@ -144,34 +164,22 @@ def gerar_parte2_report(bfs_res, dfs_res, dijkstra_res, bellman_res, out_dir):
     with open(os.path.join(out_dir, "parte2_report.json"), "w", encoding="utf-8") as f:
         json.dump(tabela, f, ensure_ascii=False, indent=2)
 
-def init_dataset_voos():
+def init_dataset_voos(dataset=None):
     out_dir = "out"
     os.makedirs(out_dir, exist_ok=True)
     dataset_path = "data/dataset_parte2/adjacencias_voos.csv"
-    gerar_info_dataset_voos(dataset_path, os.path.join(out_dir, "parte2_dataset_info.json"))
-
-    g_dijkstra = defaultdict(list)
-    g_bellman = defaultdict(list)
-
-    with open(dataset_path, encoding="utf-8") as f:
-        reader = csv.DictReader(f, skipinitialspace=True)
-        for row in reader:
-            origem = row["Origem"].strip()
-            destino = row["Destino"].strip()
-            classe = row["Classe"].strip().lower()
-            peso = float(row["Peso"])
-
-            g_dijkstra[origem].append((destino, abs(peso)))
+    if dataset is None:
+        dataset = load_voos(dataset_path)
+    gerar_info_dataset_voos(dataset, os.path.join(out_dir, "parte2_dataset_info.json"))
 
-            if classe == "economica":
-                peso_bf = -abs(peso)
-            else:
-                peso_bf = abs(peso)
-            g_bellman[origem].append((destino, peso_bf))
+    g_dijkstra = dataset.adjacencia(colapsada=True)
+    g_bellman = dataset.adjacencia(assinada=True, colapsada=True)
 
     fontes = ["Mumbai", "Delhi", "Chennai"]
     bfs_res = rodar_bfs_graphs(g_dijkstra, fontes, out_dir)
     dfs_res = rodar_dfs_graphs(g_dijkstra, fontes, out_dir)
+    with open(os.path.join(out_dir, "bfs_dfs_resultados.json"), "w", encoding="utf-8") as f:
+        json.dump({**bfs_res, **dfs_res}, f, ensure_ascii=False, indent=2)
 
     pares = [
         ("Mumbai", "Delhi"),
@@ -193,12 +201,13 @@ def init_dataset_voos():
     plot_histograma_graus_voos(
         dataset_path=dataset_path,
         out_path=os.path.join(out_dir, "parte2_histograma_graus_voos.png"),
+        dataset=dataset,
     )
 
     print("Pipeline parte 2 executada com sucesso!")
 
-def main():
-    init_dataset_voos()
+def main(dataset=None):
+    init_dataset_voos(dataset)
 
 if __name__ == "__main__":
     main()
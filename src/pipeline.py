@@ -0,0 +1,202 @@
+import io
+import json
+import os
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import redirect_stdout
+
+from src.graphs.io import hash_arquivo
+from src.graphs.perfil import Perfil, ativar
+
+
+class Etapa:
+    def __init__(self, nome, funcao, entradas, saidas):
+        self.nome = nome
+        self.funcao = funcao
+        self.entradas = list(entradas)
+        self.saidas = list(saidas)
+
+
+def hash_arquivos(caminhos):
+    return {
+        caminho: hash_arquivo(caminho) if os.path.exists(caminho) else None
+        for caminho in caminhos
+    }
+
+
+class Pipeline:
+    def __init__(self, etapas, manifesto_path="out/manifesto.json"):
+        self.etapas = {etapa.nome: etapa for etapa in etapas}
+        self.manifesto_path = manifesto_path
+        self.produtor = {}
+
+        for etapa in etapas:
+            for saida in etapa.saidas:
+                self.produtor[saida] = etapa.nome
+
+    def dependencias(self, nome):
+        etapa = self.etapas[nome]
+        deps = []
+        for entrada in etapa.entradas:
+            produtor = self.produtor.get(entrada)
+            if produtor is not None and produtor != nome and produtor not in deps:
+                deps.append(produtor)
+        return deps
+
+    def ordem(self):
+        ordem = []
+        estado = {}
+
+        for raiz in self.etapas:
+            if raiz in estado:
+                continue
+            estado[raiz] = "aberta"
+            pilha = [(raiz, iter(self.dependencias(raiz)))]
+
+            while pilha:
+                nome, deps = pilha[-1]
+                for dep in deps:
+                    if dep not in estado:
+                        estado[dep] = "aberta"
+                        pilha.append((dep, iter(self.dependencias(dep))))
+                        break
+                    if estado[dep] == "aberta":
+                        raise ValueError(f"Ciclo de dependências entre etapas: {nome} -> {dep}")
+                else:
+                    pilha.pop()
+                    estado[nome] = "fechada"
+                    ordem.append(nome)
+
+        return ordem
+
+    def carregar_manifesto(self):
+        if not os.path.exists(self.manifesto_path):
+            return {}
+        try:
+            with open(self.manifesto_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def salvar_manifesto(self, manifesto):
+        os.makedirs(os.path.dirname(self.manifesto_path) or ".", exist_ok=True)
+        with open(self.manifesto_path, "w", encoding="utf-8") as f:
+            json.dump(manifesto, f, ensure_ascii=False, indent=2)
+
+    def precisa_rodar(self, etapa, manifesto):
+        registro = manifesto.get(etapa.nome)
+        if registro is None:
+            return True
+        if registro.get("entradas") != hash_arquivos(etapa.entradas):
+            return True
+        return registro.get("saidas") != hash_arquivos(etapa.saidas)
+
+    def registrar(self, etapa, manifesto):
+        saidas = hash_arquivos(etapa.saidas)
+        faltando = [caminho for caminho, h in saidas.items() if h is None]
+        if faltando:
+            manifesto.pop(etapa.nome, None)
+            return f"saídas não geradas: {', '.join(faltando)}"
+
+        manifesto[etapa.nome] = {
+            "entradas": hash_arquivos(etapa.entradas),
+            "saidas": saidas,
+        }
+        return None
+
+    def executar(self, forcar=False, processos=1, perfil=None):
+        manifesto = self.carregar_manifesto()
+        ordem = self.ordem()
+        pendentes = list(ordem)
+        status = {}
+        logs = {}
+        falhas = {}
+        em_execucao = {}
+        impressos = 0
+        perfilar = perfil is not None
+        cprofile_dir = perfil.cprofile_dir if perfilar else None
+        executor = ProcessPoolExecutor(max_workers=processos) if processos > 1 else None
+
+        def concluir(nome, resultado):
+            saida, erro, detalhe, registros = resultado
+            if perfil is not None:
+                perfil.registros.extend(registros)
+            etapa = self.etapas[nome]
+            if erro is None:
+                erro = self.registrar(etapa, manifesto)
+            else:
+                manifesto.pop(nome, None)
+
+            if erro:
+                status[nome] = "falhou"
+                falhas[nome] = detalhe or erro
+                logs[nome] = saida + f"[{nome}] falhou: {erro}\n"
+            else:
+                status[nome] = "executada"
+                logs[nome] = saida + f"[{nome}] executada\n"
+
+            self.salvar_manifesto(manifesto)
+
+        try:
+            while pendentes or em_execucao:
+                for nome in list(pendentes):
+                    deps = self.dependencias(nome)
+                    if any(dep not in status for dep in deps):
+                        continue
+                    pendentes.remove(nome)
+                    etapa = self.etapas[nome]
+
+                    bloqueio = [dep for dep in deps if status[dep] in ("falhou", "bloqueada")]
+                    if bloqueio:
+                        status[nome] = "bloqueada"
+                        logs[nome] = f"[{nome}] bloqueada por falha em: {', '.join(bloqueio)}\n"
+                    elif not forcar and not self.precisa_rodar(etapa, manifesto):
+                        status[nome] = "atualizada"
+                        logs[nome] = f"[{nome}] atualizada, nada a fazer\n"
+                    elif executor is None:
+                        concluir(nome, _rodar_etapa(etapa.funcao, nome, perfilar, cprofile_dir))
+                    else:
+                        futuro = executor.submit(_rodar_etapa, etapa.funcao, nome, perfilar, cprofile_dir)
+                        em_execucao[futuro] = nome
+
+                if em_execucao:
+                    prontos, _ = wait(em_execucao, return_when=FIRST_COMPLETED)
+                    for futuro in prontos:
+                        nome = em_execucao.pop(futuro)
+                        try:
+                            resultado = futuro.result()
+                        except Exception as e:
+                            resultado = ("", f"{type(e).__name__}: {e}", traceback.format_exc(), [])
+                        concluir(nome, resultado)
+
+                while impressos < len(ordem) and ordem[impressos] in logs:
+                    print(logs[ordem[impressos]], end="")
+                    impressos += 1
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        if falhas:
+            print("Resumo das falhas:")
+            for nome in ordem:
+                if nome in falhas:
+                    print(f"--- {nome} ---")
+                    print(falhas[nome].rstrip())
+
+        return status
+
+
+def _rodar_etapa(funcao, nome=None, perfilar=False, cprofile_dir=None):
+    saida = io.StringIO()
+    perfil = Perfil(cprofile_dir) if perfilar else None
+    try:
+        with redirect_stdout(saida):
+            if perfil is None:
+                funcao()
+            else:
+                with ativar(perfil), perfil.medir(nome):
+                    funcao()
+    except Exception as e:
+        registros = perfil.registros if perfil else []
+        return saida.getvalue(), f"{type(e).__name__}: {e}", traceback.format_exc(), registros
+    return saida.getvalue(), None, None, perfil.registros if perfil else []
@@ -1,27 +1,42 @@
 import csv
 import json
 import os
-import heapq
-from math import inf
 
 from src.graphs.io import (
     load_bairros_csv,
     save_csv,
-    load_adjacencias,
+    iter_adjacencias,
+    hash_arquivo,
+    VERSAO_PARSER,
 )
 from src.graphs.graph import Graph
+from src.graphs.cache import carregar_grafo_em_cache
+from src.graphs.indice import IndiceCaminhos
+from src.graphs.contracao import HierarquiaContracao
 
-from src.graphs.algorithms import dijkstra
+from src.graphs.algorithms import caminho_minimo
+from src.graphs.perfil import medido
 
-def construir_grafo(filepath_adjacencias: str) -> Graph:
-    adj_list = load_adjacencias(filepath_adjacencias)
-    grafo = Graph()
+@medido()
+def construir_grafo(filepath_adjacencias: str, cache_dir: str = "out/cache") -> Graph:
+    if cache_dir is None:
+        return _ler_grafo_adjacencias(filepath_adjacencias)
 
-    for origem, destino, logradouro, observacao, peso in adj_list:
-        grafo.add_edge(origem, destino, peso)
+    return carregar_grafo_em_cache(
+        filepath_adjacencias, "bairros", _ler_grafo_adjacencias, cache_dir
+    )
+
+def _ler_grafo_adjacencias(filepath_adjacencias: str) -> Graph:
+    grafo = Graph()
+    grafo.add_edges(
+        (origem, destino, peso)
+        for origem, destino, logradouro, observacao, peso
+        in iter_adjacencias(filepath_adjacencias)
+    )
 
     return grafo
 
+@medido()
 def gerar_microrregioes_json(filepath_bairros):
     cebecas, linhas = load_bairros_csv(filepath_bairros)
     bairro_para_micro = {}
@@ -58,90 +73,137 @@ def gerar_bairros_unique_csv(
     ]
     save_csv(filepath, linhas, header=["bairro", "microrregiao"])
 
+@medido()
 def agrupar_nos_microrregioes(grafo: Graph, bairro_para_micro: dict):
     micros = {}
+    volumes = {}
+    volume_total = 0
     for bairro in grafo.nodes():
+        grau = grafo.degree(bairro)
+        volume_total += grau
         microrregiao = bairro_para_micro.get(bairro)
         if not microrregiao:
             continue
         micros.setdefault(microrregiao, set()).add(bairro)
+        volumes[microrregiao] = volumes.get(microrregiao, 0) + grau
+
+    matriz = {microrregiao: {} for microrregiao in micros}
+    cortes = {microrregiao: 0 for microrregiao in micros}
+
+    for origem, destino, _ in grafo.edges():
+        micro_origem = bairro_para_micro.get(origem) or None
+        micro_destino = bairro_para_micro.get(destino) or None
+
+        if micro_origem == micro_destino:
+            if micro_origem is not None:
+                linha = matriz[micro_origem]
+                linha[micro_origem] = linha.get(micro_origem, 0) + 1
+            continue
+
+        for atual, outra in ((micro_origem, micro_destino), (micro_destino, micro_origem)):
+            if atual is None:
+                continue
+            cortes[atual] += 1
+            if outra is not None:
+                linha = matriz[atual]
+                linha[outra] = linha.get(outra, 0) + 1
 
-    edges = grafo.edges()
     resultados = []
 
     for microrregiao, bairros_set in sorted(micros.items(), key=lambda x: int(x[0])):
         ordem = len(bairros_set)
-        tamanho = 0
-
-        for origem, destino, _ in edges:
-            if origem in bairros_set and destino in bairros_set:
-                tamanho += 1
+        linha = matriz[microrregiao]
+        tamanho = linha.get(microrregiao, 0)
 
         if ordem <= 1:
             densidade = 0.0
         else:
             densidade = (2 * tamanho) / (ordem * (ordem - 1))
 
+        volume = volumes[microrregiao]
+        menor_volume = min(volume, volume_total - volume)
+        if menor_volume <= 0:
+            condutancia = 0.0
+        else:
+            condutancia = cortes[microrregiao] / menor_volume
+
         resultados.append(
             {
                 "microrregiao": microrregiao,
                 "ordem": ordem,
                 "tamanho": tamanho,
                 "densidade": densidade,
+                "corte": cortes[microrregiao],
+                "condutancia": condutancia,
+                "arestas_entre": {
+                    outra: qtd
+                    for outra, qtd in sorted(linha.items(), key=lambda x: int(x[0]))
+                    if outra != microrregiao
+                },
             }
         )
 
     return resultados
 
 def calcular_metricas_globais(grafo: Graph) -> dict:
-    num_nos = len(grafo.nodes())
-    num_arestas = len(grafo.edges())
-
-    if num_nos <= 1:
-        densidade = 0.0
-    else:
-        densidade = (2 * num_arestas) / (num_nos * (num_nos - 1))
-
     return {
-        "ordem": num_nos,
-        "tamanho": num_arestas,
-        "densidade": densidade,
+        "ordem": grafo.ordem(),
+        "tamanho": grafo.tamanho(),
+        "densidade": grafo.densidade(),
     }
 
-def dijkstra_caminho(grafo: Graph, origem: str, destino: str):
-    distancias = {no: inf for no in grafo.nodes()}
-    anteriores = {no: None for no in grafo.nodes()}
-    distancias[origem] = 0.0
+def dijkstra_caminho(grafo: Graph, origem: str, destino: str, fila: str = None):
+    return caminho_minimo(grafo.adj, origem, destino, fila)
 
-    heap = [(0.0, origem)]
+def _chave_fonte(filepath_adjacencias: str) -> str:
+    return f"{hash_arquivo(filepath_adjacencias)}-p{VERSAO_PARSER}"
 
-    while heap:
-        custo_atual, no_atual = heapq.heappop(heap)
+@medido()
+def carregar_indice_caminhos(
+    filepath_adjacencias: str,
+    grafo: Graph,
+    filepath_indice: str = "out/indice_caminhos.json",
+):
+    fonte_hash = _chave_fonte(filepath_adjacencias)
 
-        if no_atual == destino:
-            break
+    if os.path.exists(filepath_indice):
+        indice = IndiceCaminhos.carregar(filepath_indice)
+        if indice is not None and indice.fonte_hash == fonte_hash:
+            return indice
 
-        if custo_atual > distancias[no_atual]:
-            continue
+    indice = IndiceCaminhos.construir(grafo.adj, fonte_hash)
+    os.makedirs(os.path.dirname(filepath_indice), exist_ok=True)
+    indice.salvar(filepath_indice)
+
+    return indice
+
+@medido()
+def carregar_hierarquia_contracao(
+    filepath_adjacencias: str,
+    grafo: Graph = None,
+    filepath_hierarquia: str = "out/hierarquia_contracao.json",
+):
+    fonte_hash = _chave_fonte(filepath_adjacencias)
 
-        for vizinho, peso in grafo.neighbors(no_atual):
-            novo_custo = custo_atual + peso
-            if novo_custo < distancias[vizinho]:
-                distancias[vizinho] = novo_custo
-                anteriores[vizinho] = no_atual
-                heapq.heappush(heap, (novo_custo, vizinho))
+    if os.path.exists(filepath_hierarquia):
+        hierarquia = HierarquiaContracao.carregar(filepath_hierarquia)
+        if hierarquia is not None and hierarquia.fonte_hash == fonte_hash:
+            return hierarquia
 
-    if distancias[destino] == inf:
-        return inf, []
+    if grafo is None:
+        grafo = construir_grafo(filepath_adjacencias)
+    hierarquia = HierarquiaContracao.construir(grafo.adj, fonte_hash)
+    os.makedirs(os.path.dirname(filepath_hierarquia), exist_ok=True)
+    hierarquia.salvar(filepath_hierarquia)
 
-    caminho = []
-    atual = destino
-    while atual is not None:
-        caminho.append(atual)
-        atual = anteriores[atual]
-    caminho.reverse()
+    return hierarquia
 
-    return distancias[destino], caminho
+def gerar_hierarquia_contracao(filepath_adjacencias: str = "data/adjacencias_bairros.csv"):
+    carregar_hierarquia_contracao(filepath_adjacencias)
+
+def rota(origem: str, destino: str, filepath_adjacencias: str = "data/adjacencias_bairros.csv"):
+    hierarquia = carregar_hierarquia_contracao(filepath_adjacencias)
+    return hierarquia.consultar(origem, destino)
 
 def calcular_graus(grafo: Graph):
     graus = [(bairro, grafo.degree(bairro)) for bairro in grafo.nodes()]
@@ -149,28 +211,53 @@ def calcular_graus(grafo: Graph):
 
     return graus
 
+@medido()
 def calcular_ego(grafo: Graph):
     ego_info = []
-    todas_arestas = grafo.edges()
 
     for bairro in grafo.nodes():
-        vizinhos = [vizinho for (vizinho, _) in grafo.neighbors(bairro)]
-        grau = len(vizinhos)
-
-        nos_ego = set([bairro] + vizinhos)
-        ordem_ego = len(nos_ego)
-
-        tamanho_ego = 0
-        for origem, destino, _ in todas_arestas:
-            if origem in nos_ego and destino in nos_ego:
-                tamanho_ego += 1
+        grau = grafo.degree(bairro)
+        conjunto = grafo.neighbor_set(bairro)
+        vizinhos = conjunto - {bairro}
+        k = len(vizinhos)
+
+        ordem_ego = k + 1
+        lacos = 1 if bairro in conjunto else 0
+        incidencias_pares = 0
+        segundo_nivel = set(conjunto)
+        segundo_nivel.add(bairro)
+
+        for vizinho in vizinhos:
+            vizinhos_do_vizinho = grafo.neighbor_set(vizinho)
+            comuns = len(vizinhos & vizinhos_do_vizinho)
+            if vizinho in vizinhos_do_vizinho:
+                lacos += 1
+                comuns -= 1
+            incidencias_pares += comuns
+            segundo_nivel |= vizinhos_do_vizinho
+
+        triangulos = incidencias_pares // 2
+        tamanho_ego = k + triangulos + lacos
 
         if ordem_ego <= 1:
             densidade_ego = 0.0
         else:
             densidade_ego = (2 * tamanho_ego) / (ordem_ego * (ordem_ego - 1))
 
-        ego_info.append((bairro, grau, ordem_ego, tamanho_ego, densidade_ego))
+        if k < 2:
+            coef_agrupamento = 0.0
+        else:
+            coef_agrupamento = (2 * triangulos) / (k * (k - 1))
+
+        ego_info.append((
+            bairro,
+            grau,
+            ordem_ego,
+            tamanho_ego,
+            densidade_ego,
+            coef_agrupamento,
+            len(segundo_nivel),
+        ))
 
     ego_info.sort(key=lambda x: x[0])
 
@@ -187,7 +274,12 @@ def normalizar_bairro_destino(bairro: str) -> str:
 
     return nome
 
-def calcular_distancias_enderecos(g: Graph, filepath_enderecos: str = "data/enderecos.csv"):
+@medido()
+def calcular_distancias_enderecos(
+    g: Graph,
+    filepath_enderecos: str = "data/enderecos.csv",
+    indice: IndiceCaminhos = None,
+):
     linhas_saida = []
     percurso_nd_setubal = None
 
@@ -200,7 +292,10 @@ def calcular_distancias_enderecos(g: Graph, filepath_enderecos: str = "data/ende
             bairro_Y_original = row["bairro_Y"].strip()
             bairro_Y = normalizar_bairro_destino(bairro_Y_original)
 
-            custo, caminho = dijkstra_caminho(g, bairro_X, bairro_Y)
+            if indice is not None:
+                custo, caminho = indice.consultar(bairro_X, bairro_Y)
+            else:
+                custo, caminho = dijkstra_caminho(g, bairro_X, bairro_Y)
             caminho_str = " -> ".join(caminho) if caminho else ""
 
             linhas_saida.append([
@@ -240,10 +335,7 @@ def init():
         ego = calcular_ego(grafo)
         ranking = calcular_ranking(graus, ego)
         linhas_graus = [[bairro, grau] for (bairro, grau) in graus]
-        linhas_ego = [
-            [bairro, grau, ordem_ego, tamanho_ego, dens_ego]
-            for (bairro, grau, ordem_ego, tamanho_ego, dens_ego) in ego
-        ]
+        linhas_ego = [list(linha) for linha in ego]
 
         # Garante out/
         os.makedirs("out", exist_ok=True)
@@ -254,15 +346,32 @@ def init():
         save_csv(
             os.path.join("out", "ego_bairro.csv"),
             linhas_ego,
-            header=["bairro", "grau", "ordem_ego", "tamanho_ego", "densidade_ego"],
+            header=[
+                "bairro",
+                "grau",
+                "ordem_ego",
+                "tamanho_ego",
+                "densidade_ego",
+                "coef_agrupamento",
+                "ordem_ego_2",
+            ],
         )
         criar_arquivo_json("ranking_bairros.json", ranking)
-        gerar_distancias_enderecos("data/enderecos.csv", "out", grafo)
+        indice = carregar_indice_caminhos("data/adjacencias_bairros.csv", grafo)
+        gerar_distancias_enderecos("data/enderecos.csv", "out", grafo, indice)
     except Exception as e:
         print(f"Erro ao inicializar os arquivos de saída: {e}")
+        raise
 
-def gerar_distancias_enderecos(filepath_enderecos: str, out_dir: str, grafo: Graph):
-    linhas, percurso_nd_setubal = calcular_distancias_enderecos(grafo, filepath_enderecos)
+def gerar_distancias_enderecos(
+    filepath_enderecos: str,
+    out_dir: str,
+    grafo: Graph,
+    indice: IndiceCaminhos = None,
+):
+    linhas, percurso_nd_setubal = calcular_distancias_enderecos(
+        grafo, filepath_enderecos, indice
+    )
 
     save_csv(
         os.path.join(out_dir, "distancias_enderecos.csv"),
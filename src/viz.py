@@ -6,7 +6,7 @@ from pyvis.network import Network
 import matplotlib.pyplot as plt
 
 from src.solve import construir_grafo
-from src.graphs.io import load_adjacencias
+from src.graphs.io import DatasetVoos, load_voos
 
 MICRO_CORES = {
     "1": "#1E88E5",
@@ -703,18 +703,15 @@ def plot_top10_grau(
 def plot_histograma_graus_voos(
     dataset_path: str = "data/dataset_parte2/adjacencias_voos.csv",
     out_path: str = "out/parte2_histograma_graus_voos.png",
+    dataset: DatasetVoos = None,
 ):
 
-    if not os.path.exists(dataset_path):
-        return
-
-    graus_por_cidade = {}
+    if dataset is None:
+        if not os.path.exists(dataset_path):
+            return
+        dataset = load_voos(dataset_path)
 
-    with open(dataset_path, encoding="utf-8") as f:
-        reader = csv.DictReader(f, skipinitialspace=True)
-        for row in reader:
-            origem = row["Origem"].strip()
-            graus_por_cidade[origem] = graus_por_cidade.get(origem, 0) + 1
+    graus_por_cidade = dataset.graus_saida
 
     if not graus_por_cidade:
         return
@@ -862,22 +859,18 @@ def gerar_grafo_voos_bfs_dfs_html(
     dataset_path: str = "data/dataset_parte2/adjacencias_voos.csv",
     bfs_dfs_json_path: str = "out/bfs_dfs_resultados.json",
     html_path: str = "out/parte2_grafo_voos_bfs_dfs.html",
+    dataset: DatasetVoos = None,
 ):
-    if not os.path.exists(dataset_path) or not os.path.exists(bfs_dfs_json_path):
+    if not os.path.exists(bfs_dfs_json_path):
         return
 
-    nos = set()
-    arestas_contadas = {}
+    if dataset is None:
+        if not os.path.exists(dataset_path):
+            return
+        dataset = load_voos(dataset_path)
 
-    with open(dataset_path, encoding="utf-8") as f:
-        reader = csv.DictReader(f, skipinitialspace=True)
-        for row in reader:
-            origem = row["Origem"].strip()
-            destino = row["Destino"].strip()
-            nos.add(origem)
-            nos.add(destino)
-            chave = (origem, destino)
-            arestas_contadas[chave] = arestas_contadas.get(chave, 0) + 1
+    nos = set(dataset.nos)
+    arestas_contadas = dataset.contagem_arestas
 
     if not nos:
         return
@@ -995,8 +988,8 @@ def gerar_grafo_voos_bfs_dfs_html(
     print(html_path)
 
 
-def gerar_visualizacao_parte2():
-    gerar_grafo_voos_bfs_dfs_html()
+def gerar_visualizacao_parte2(dataset: DatasetVoos = None):
+    gerar_grafo_voos_bfs_dfs_html(dataset=dataset)
 
 def init_visualizacao():
 
@@ -1005,4 +998,3 @@ def init_visualizacao():
     plot_histograma_graus()
     plot_top10_grau()
     gerar_subgrafo_top10_grau_html()
-    plot_histograma_graus_voos()
@@ -1,5 +1,9 @@
 import pytest
-from src.graphs.algorithms import bellman_ford
+import json
+import math
+import random
+from src.graphs.algorithms import bellman_ford, bellman_ford_fila, johnson, potenciais_johnson
+from src.parte2_algoritmos import rodar_bellman_ford_graphs
 
 def test_bellman_ford_distancias_positivas():
     graph = {
@@ -55,3 +59,128 @@ def test_bellman_ford_sem_caminho():
 
     assert result['C'] == float('inf')
     assert result['D'] == float('inf')
+
+
+def test_bellman_ford_fila_extrai_ciclo_negativo():
+    graph = {
+        'S': [('A', 1), ('X', 3)],
+        'A': [('B', 1)],
+        'B': [('C', -2)],
+        'C': [('A', -1), ('D', 1)],
+        'D': [],
+        'X': [('Y', 2)],
+        'Y': []
+    }
+
+    resultado = bellman_ford_fila(graph, 'S')
+
+    assert len(resultado["ciclos"]) == 1
+    ciclo = resultado["ciclos"][0]
+    assert sorted(ciclo) == ['A', 'B', 'C']
+    assert resultado["infinito_negativo"] == {'A', 'B', 'C', 'D'}
+    assert resultado["distancias"]['D'] == float('-inf')
+    assert resultado["distancias"]['Y'] == 5
+
+
+def grafo_com_potenciais(n, m, semente):
+    rnd = random.Random(semente)
+    potencial = [rnd.randint(0, 20) for _ in range(n)]
+    graph = {i: [] for i in range(n)}
+    for _ in range(m):
+        u, v = rnd.randrange(n), rnd.randrange(n)
+        graph[u].append((v, float(rnd.randint(0, 10) - potencial[u] + potencial[v])))
+    return graph
+
+
+def test_johnson_igual_ao_bellman_ford_por_origem():
+    for semente in range(10):
+        graph = grafo_com_potenciais(30, 120, semente)
+        todas = johnson(graph)
+
+        assert set(todas) == set(graph)
+        for origem in graph:
+            assert todas[origem] == pytest.approx(bellman_ford(graph, origem))
+
+
+def test_rodar_bellman_ford_reaproveita_a_fonte_virtual_com_ciclos(tmp_path):
+    metodos = set()
+    for semente in range(30):
+        rnd = random.Random(semente)
+        graph = {i: [] for i in range(25)}
+        for _ in range(45):
+            graph[rnd.randrange(25)].append((rnd.randrange(25), float(rnd.randint(-3, 9))))
+
+        casos = [(origem, destino) for origem in range(0, 25, 5) for destino in range(25)]
+        resultados = rodar_bellman_ford_graphs(graph, casos, str(tmp_path))
+
+        for origem in range(0, 25, 5):
+            esperado = bellman_ford_fila(graph, origem)
+            for destino in range(25):
+                resultado = resultados[f"BellmanFord_{origem}_{destino}"]
+                metodos.add(resultado["metodo"])
+                assert resultado["nos_infinito_negativo"] == sorted(esperado["infinito_negativo"])
+                assert resultado["ciclo_negativo"] == bool(esperado["ciclos"])
+                if resultado["custo"] is None:
+                    assert not math.isfinite(esperado["distancias"][destino])
+                else:
+                    assert resultado["custo"] == pytest.approx(esperado["distancias"][destino])
+
+    assert metodos == {'johnson', 'spfa'}
+
+
+def test_rodar_bellman_ford_custo_e_a_soma_do_caminho(tmp_path):
+    rnd = random.Random(7)
+    potencial = [rnd.randint(0, 20) for _ in range(40)]
+    graph = {i: [] for i in range(40)}
+    for _ in range(200):
+        u, v = rnd.randrange(40), rnd.randrange(40)
+        graph[u].append((v, rnd.randint(0, 1000) / 100 - potencial[u] + potencial[v]))
+
+    casos = [(0, destino) for destino in range(1, 40)]
+    resultados = rodar_bellman_ford_graphs(graph, casos, str(tmp_path))
+    esperado = bellman_ford(graph, 0)
+
+    for origem, destino in casos:
+        resultado = resultados[f"BellmanFord_{origem}_{destino}"]
+        if resultado["custo"] is None:
+            assert esperado[destino] == float('inf')
+            continue
+
+        soma = 0.0
+        for u, v in zip(resultado["caminho"], resultado["caminho"][1:]):
+            soma += min(p for w, p in graph[u] if w == v)
+        assert resultado["custo"] == soma
+        assert resultado["custo"] == pytest.approx(esperado[destino])
+
+
+def test_johnson_com_ciclo_negativo():
+    graph = {
+        'A': [('B', 1)],
+        'B': [('C', -2)],
+        'C': [('A', -1)],
+    }
+
+    assert potenciais_johnson(graph) is None
+    with pytest.raises(ValueError):
+        johnson(graph)
+
+
+def test_rodar_bellman_ford_reaproveita_potenciais(tmp_path):
+    sem_ciclo = {'A': [('B', 4.0), ('C', 2.0)], 'B': [], 'C': [('B', -1.0)]}
+    resultados = rodar_bellman_ford_graphs(sem_ciclo, [('A', 'B'), ('A', 'C')], str(tmp_path))
+
+    assert resultados['BellmanFord_A_B']['metodo'] == 'johnson'
+    assert resultados['BellmanFord_A_B']['custo'] == pytest.approx(1.0)
+    assert resultados['BellmanFord_A_B']['caminho'] == ['A', 'C', 'B']
+    assert resultados['BellmanFord_A_C']['ciclo_negativo'] is False
+
+    com_ciclo = {'A': [('B', 1.0)], 'B': [('A', -2.0)]}
+    resultados = rodar_bellman_ford_graphs(com_ciclo, [('A', 'B')], str(tmp_path))
+
+    assert resultados['BellmanFord_A_B']['metodo'] == 'johnson'
+    assert resultados['BellmanFord_A_B']['ciclo_negativo'] is True
+    assert resultados['BellmanFord_A_B']['custo'] is None
+    assert resultados['BellmanFord_A_B']['nos_infinito_negativo'] == ['A', 'B']
+
+    with open(tmp_path / "bellman_ford_resultados.json", encoding="utf-8") as f:
+        assert json.loads(f.read(), parse_constant=pytest.fail)['BellmanFord_A_B']['custo'] is None
@@ -1,5 +1,5 @@
 import pytest
-from src.graphs.algorithms import bfs
+from src.graphs.algorithms import bfs, bfs_arvore, reconstruir_caminho
 
 def test_bfs():
     graph = {
@@ -21,3 +21,36 @@ def test_bfs():
         'D': 2,
         'E': 2
     }
+
+
+def test_bfs_para_no_destino_e_respeita_profundidade():
+    graph = {
+        'A': ['B', 'C'],
+        'B': ['D'],
+        'C': ['E'],
+        'D': ['F'],
+        'E': [],
+        'F': []
+    }
+
+    ordem, _ = bfs(graph, 'A', destino='C')
+    assert ordem == ['A', 'B', 'C']
+
+    ordem, camadas = bfs(graph, 'A', profundidade_max=1)
+    assert ordem == ['A', 'B', 'C']
+    assert 'D' not in camadas
+
+
+def test_bfs_arvore_reconstroi_caminho():
+    graph = {
+        'A': [('B', 5), ('C', 1)],
+        'B': [('D', 1)],
+        'C': [('D', 1)],
+        'D': []
+    }
+
+    _, camadas, pais = bfs_arvore(graph, 'A')
+
+    assert camadas['D'] == 2
+    assert reconstruir_caminho(pais, 'D') == ['A', 'B', 'D']
+    assert reconstruir_caminho(pais, 'Z') == []
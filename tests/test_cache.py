@@ -0,0 +1,88 @@
+import os
+import pytest
+from src.graphs import cache
+from src.graphs.cache import carregar_grafo_em_cache, ler_grafo_binario, salvar_grafo_binario
+from src.solve import construir_grafo
+
+def test_cache_binario_reproduz_o_grafo(tmp_path):
+    csv_path = tmp_path / "adj.csv"
+    csv_path.write_text(
+        'Recife, Santo Amaro, Ponte de Limoeiro, “Acesso por Ponte”, 1.0\n'
+        'Santo Amaro, Boa Vista, Rua 13 de Maio, “Acesso por Rua”, 2.0\n'
+        'Boa Vista, Recife, Rua da Aurora, “Acesso por Rua”, 2.5\n',
+        encoding="utf-8",
+    )
+    original = construir_grafo(str(csv_path), cache_dir=None)
+
+    binario = tmp_path / "grafo.bin"
+    salvar_grafo_binario(original, str(binario))
+    lido = ler_grafo_binario(str(binario))
+
+    assert lido.adj == original.adj
+    assert lido.edges() == original.edges()
+
+
+def test_cache_reconstroi_quando_csv_muda(tmp_path):
+    csv_path = tmp_path / "adj.csv"
+    csv_path.write_text('A, B, Rua X, “Acesso por Rua”, 2.0\n', encoding="utf-8")
+    chamadas = []
+
+    def construtor(caminho):
+        chamadas.append(caminho)
+        return construir_grafo(caminho, cache_dir=None)
+
+    cache_dir = tmp_path / "cache"
+    carregar_grafo_em_cache(str(csv_path), "bairros", construtor, str(cache_dir))
+    grafo = carregar_grafo_em_cache(str(csv_path), "bairros", construtor, str(cache_dir))
+    assert len(chamadas) == 1
+    assert grafo.neighbors('A') == [('B', 2.0)]
+
+    csv_path.write_text('A, C, Rua Y, “Acesso por Rua”, 1.0\n', encoding="utf-8")
+    grafo = carregar_grafo_em_cache(str(csv_path), "bairros", construtor, str(cache_dir))
+    assert len(chamadas) == 2
+    assert grafo.neighbors('A') == [('C', 1.0)]
+    assert len(list(cache_dir.iterdir())) == 1
+
+
+def test_cache_tolera_entrada_antiga_removida_por_outro_processo(tmp_path, monkeypatch):
+    csv_path = tmp_path / "adj.csv"
+    csv_path.write_text('A, B, Rua X, “Acesso por Rua”, 2.0\n', encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+    construtor = lambda caminho: construir_grafo(caminho, cache_dir=None)
+    carregar_grafo_em_cache(str(csv_path), "bairros", construtor, str(cache_dir))
+    antigos = [str(p) for p in cache_dir.iterdir()]
+
+    glob_original = cache.glob.glob
+
+    def glob_com_corrida(padrao):
+        encontrados = glob_original(padrao)
+        for antigo in antigos:
+            os.remove(antigo)
+        return encontrados
+
+    monkeypatch.setattr(cache.glob, "glob", glob_com_corrida)
+    csv_path.write_text('A, C, Rua Y, “Acesso por Rua”, 1.0\n', encoding="utf-8")
+    grafo = carregar_grafo_em_cache(str(csv_path), "bairros", construtor, str(cache_dir))
+
+    assert grafo.neighbors('A') == [('C', 1.0)]
+    assert len(list(cache_dir.iterdir())) == 1
+
+
+def test_cache_separa_csvs_com_o_mesmo_nome(tmp_path):
+    primeiro = tmp_path / "adjacencias_bairros.csv"
+    primeiro.write_text('A, B, Rua X, “Acesso por Rua”, 2.0\n', encoding="utf-8")
+    (tmp_path / "sintetico").mkdir()
+    segundo = tmp_path / "sintetico" / "adjacencias_bairros.csv"
+    segundo.write_text('A, C, Rua Y, “Acesso por Rua”, 1.0\n', encoding="utf-8")
+    chamadas = []
+
+    def construtor(caminho):
+        chamadas.append(caminho)
+        return construir_grafo(caminho, cache_dir=None)
+
+    cache_dir = str(tmp_path / "cache")
+    for _ in range(2):
+        assert carregar_grafo_em_cache(str(primeiro), "bairros", construtor, cache_dir).neighbors('A') == [('B', 2.0)]
+        assert carregar_grafo_em_cache(str(segundo), "bairros", construtor, cache_dir).neighbors('A') == [('C', 1.0)]
+
+    assert chamadas == [str(primeiro), str(segundo)]
@@ -0,0 +1,113 @@
+import pytest
+import random
+
+from src.graphs.algorithms import caminho_minimo
+from src.graphs import contracao
+from src.graphs.contracao import HierarquiaContracao
+from src.graphs.graph import Graph
+
+
+def grafo_aleatorio_inteiro(n, m, semente):
+    rnd = random.Random(semente)
+    grafo = {i: [] for i in range(n)}
+    for _ in range(m):
+        grafo[rnd.randrange(n)].append((rnd.randrange(n), float(rnd.randint(1, 9))))
+    return grafo
+
+
+def test_hierarquia_responde_como_o_dijkstra():
+    for semente in range(6):
+        grafo = grafo_aleatorio_inteiro(40, 150, semente)
+
+        hierarquia = HierarquiaContracao.construir(grafo)
+        for origem in grafo:
+            for destino in grafo:
+                assert hierarquia.consultar(origem, destino) == caminho_minimo(grafo, origem, destino)
+
+
+def test_hierarquia_desempata_como_o_dijkstra():
+    g = Graph()
+    for i in range(6):
+        for j in range(6):
+            if i + 1 < 6:
+                g.add_edge(f"{i}-{j}", f"{i + 1}-{j}", 1.0)
+            if j + 1 < 6:
+                g.add_edge(f"{i}-{j}", f"{i}-{j + 1}", 1.0)
+
+    hierarquia = HierarquiaContracao.construir(g.adj)
+    for origem in g.adj:
+        for destino in g.adj:
+            assert hierarquia.consultar(origem, destino) == caminho_minimo(g.adj, origem, destino)
+
+
+def test_hierarquia_com_pesos_zero():
+    g = Graph()
+    g.add_edges([('A', 'B', 0.0), ('B', 'C', 0.0)])
+    hierarquia = HierarquiaContracao.construir(g.adj)
+    assert hierarquia.consultar('C', 'A') == (0.0, ['C', 'B', 'A'])
+
+    for semente in range(6):
+        rnd = random.Random(semente)
+        grafo = {i: [] for i in range(30)}
+        for _ in range(100):
+            grafo[rnd.randrange(30)].append((rnd.randrange(30), float(rnd.randint(0, 3))))
+
+        hierarquia = HierarquiaContracao.construir(grafo)
+        for origem in grafo:
+            for destino in grafo:
+                assert hierarquia.consultar(origem, destino) == caminho_minimo(grafo, origem, destino)
+
+
+def test_hierarquia_com_pesos_de_soma_inexata(monkeypatch):
+    monkeypatch.setattr(contracao, "LIMITE_ORIGENS_EM_CACHE", 3)
+    for semente in range(6):
+        rnd = random.Random(semente)
+        grafo = {i: [] for i in range(30)}
+        for _ in range(120):
+            grafo[rnd.randrange(30)].append((rnd.randrange(30), rnd.choice([0.1, 0.7, 1.3])))
+
+        hierarquia = HierarquiaContracao.construir(grafo)
+        assert not hierarquia.somas_exatas
+        for origem in grafo:
+            for destino in grafo:
+                assert hierarquia.consultar(origem, destino) == caminho_minimo(grafo, origem, destino)
+
+
+def test_hierarquia_reaproveita_distancias_entre_consultas(monkeypatch):
+    monkeypatch.setattr(contracao, "LIMITE_ORIGENS_EM_CACHE", 3)
+    grafo = grafo_aleatorio_inteiro(40, 150, 3)
+    hierarquia = HierarquiaContracao.construir(grafo)
+    assert hierarquia.somas_exatas
+
+    for _ in range(2):
+        for origem in grafo:
+            for destino in grafo:
+                assert hierarquia.consultar(origem, destino) == caminho_minimo(grafo, origem, destino)
+    assert len(hierarquia._distancias) <= 3
+
+
+def test_hierarquia_persistida(tmp_path):
+    g = Graph()
+    g.add_edges([
+        ('A', 'B', 1.0),
+        ('B', 'C', 2.0),
+        ('A', 'C', 4.0),
+        ('C', 'D', 1.5),
+    ])
+    g.add_node('E')
+
+    arquivo = tmp_path / "hierarquia.json"
+    HierarquiaContracao.construir(g.adj, fonte_hash="abc").salvar(arquivo)
+    hierarquia = HierarquiaContracao.carregar(arquivo)
+
+    assert hierarquia.fonte_hash == "abc"
+    assert hierarquia.consultar('A', 'D') == (4.5, ['A', 'B', 'C', 'D'])
+    assert hierarquia.consultar('D', 'A') == (4.5, ['D', 'C', 'B', 'A'])
+    assert hierarquia.consultar('A', 'A') == (0.0, ['A'])
+    assert hierarquia.consultar('A', 'E') == (float('inf'), [])
+    assert hierarquia.consultar('A', 'Z') == (float('inf'), [])
+
+
+def test_hierarquia_rejeita_pesos_negativos():
+    with pytest.raises(ValueError):
+        HierarquiaContracao.construir({'A': [('B', -1.0)], 'B': []})
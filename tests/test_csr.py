@@ -0,0 +1,44 @@
+import pytest
+from src.graphs.graph import Graph
+from src.graphs.csr import CSRGraph
+from src.graphs.algorithms import bfs, dijkstra
+
+def montar_grafo():
+    g = Graph()
+    g.add_edge('A', 'B', 1.0)
+    g.add_edge('A', 'C', 4.0)
+    g.add_edge('B', 'C', 2.0)
+    g.add_edge('C', 'D', 1.0)
+    return g
+
+def test_csr_preserva_semantica_do_graph():
+    g = montar_grafo()
+    csr = g.compile()
+
+    assert csr.nodes() == g.nodes()
+    for no in g.nodes():
+        assert csr.neighbors(no) == g.neighbors(no)
+        assert csr.degree(no) == g.degree(no)
+    assert sorted(csr.edges()) == sorted(g.edges())
+    assert csr.neighbors('Z') == []
+    assert csr.degree('Z') == 0
+
+
+def test_csr_funciona_nos_algoritmos():
+    g = montar_grafo()
+    csr = g.compile()
+
+    assert dijkstra(csr, 'A') == dijkstra(g.adj, 'A')
+    assert bfs(csr, 'A') == bfs(g.adj, 'A')
+
+
+def test_csr_dirigido_a_partir_de_dicionario():
+    adj = {
+        'A': [('B', 2.0)],
+        'B': [('C', -1.0)],
+    }
+    csr = CSRGraph.from_adjacency(adj)
+
+    assert csr.nodes() == ['A', 'B', 'C']
+    assert csr.edges() == [('A', 'B', 2.0), ('B', 'C', -1.0)]
+    assert csr.degree('C') == 0
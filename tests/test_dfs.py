@@ -1,5 +1,5 @@
 import pytest
-from src.graphs.algorithms import dfs
+from src.graphs.algorithms import dfs, dfs_completo
 
 def test_dfs_ordem_sem_ciclo():
     graph = {
@@ -28,3 +28,34 @@ def test_dfs_detecta_ciclo():
 
     assert ('C', 'A') in ciclos
     assert len(ciclos) >= 1
+
+
+def test_dfs_completo_classifica_arestas_e_cobre_componentes():
+    graph = {
+        'A': ['B', 'C'],
+        'B': ['C'],
+        'C': ['A'],
+        'D': ['C']
+    }
+
+    resultado = dfs_completo(graph)
+    arestas = resultado["arestas"]
+
+    assert resultado["ordem"] == ['A', 'B', 'C', 'D']
+    assert arestas["arvore"] == [('A', 'B'), ('B', 'C')]
+    assert arestas["retorno"] == [('C', 'A')]
+    assert arestas["avanco"] == [('A', 'C')]
+    assert arestas["cruzamento"] == [('D', 'C')]
+    assert resultado["descoberta"]['A'] < resultado["descoberta"]['C']
+    assert resultado["finalizacao"]['C'] < resultado["finalizacao"]['A']
+
+
+def test_dfs_caminho_longo_sem_recursao():
+    n = 50000
+    graph = {i: [i + 1] for i in range(n)}
+    graph[n] = []
+
+    ordem, ciclos = dfs(graph, 0)
+
+    assert len(ordem) == n + 1
+    assert ciclos == []
@@ -1,5 +1,15 @@
 import pytest
-from src.graphs.algorithms import dijkstra
+from src.graphs.algorithms import (
+    dijkstra,
+    dial,
+    escala_inteira,
+    motor_caminhos,
+    caminho_minimo,
+    dijkstra_bidirecional,
+    a_estrela,
+    escolher_landmarks,
+    heuristica_landmarks,
+)
 
 def test_dijkstra():
     graph = {
@@ -29,3 +39,83 @@ def test_dijkstra_sem_caminho():
     result = dijkstra(graph, 'A')
     assert result['C'] == float('inf')
     assert result['D'] == float('inf')
+
+def test_dijkstra_par_unico_com_caminho():
+    graph = {
+        'A': [('B', 1), ('C', 4)],
+        'B': [('C', 2), ('D', 5)],
+        'C': [('D', 1)],
+        'D': []
+    }
+    distancias, anteriores = dijkstra(graph, 'A', 'B', predecessores=True)
+    assert distancias['B'] == 1
+    assert distancias['D'] == float('inf')
+    assert anteriores['B'] == 'A'
+
+    assert caminho_minimo(graph, 'A', 'D') == (4, ['A', 'B', 'C', 'D'])
+    assert caminho_minimo(graph, 'D', 'A') == (float('inf'), [])
+
+@pytest.mark.parametrize("fila", [None, "pareamento"])
+def test_caminho_minimo_origem_fora_do_grafo(fila):
+    graph = {
+        'A': [('B', 1)],
+        'B': [],
+    }
+    assert caminho_minimo(graph, 'Z', 'B', fila=fila) == (float('inf'), [])
+    assert dial(graph, 'Z')['B'] == float('inf')
+
+def grafo_aleatorio(n, m, semente):
+    import random
+    rnd = random.Random(semente)
+    graph = {i: [] for i in range(n)}
+    for _ in range(m):
+        u = rnd.randrange(n)
+        v = rnd.randrange(n)
+        graph[u].append((v, float(rnd.randint(1, 9))))
+    return graph
+
+def test_bidirecional_e_a_estrela_concordam_com_dijkstra():
+    graph = grafo_aleatorio(60, 240, 7)
+    heuristica = heuristica_landmarks(graph, escolher_landmarks(graph, 3))
+
+    for origem in range(0, 60, 7):
+        for destino in range(0, 60, 5):
+            custo, _ = caminho_minimo(graph, origem, destino)
+
+            custo_bi, caminho_bi = dijkstra_bidirecional(graph, origem, destino)
+            custo_a, caminho_a = a_estrela(graph, origem, destino, heuristica)
+
+            assert custo_bi == custo
+            assert custo_a == custo
+            if custo != float('inf'):
+                assert caminho_bi[0] == origem and caminho_bi[-1] == destino
+                assert caminho_a[0] == origem and caminho_a[-1] == destino
+
+@pytest.mark.parametrize("fila", ["heapq", "binario", "4-ario", "pareamento"])
+def test_dijkstra_com_filas_plugaveis(fila):
+    for semente in range(10):
+        grafo = grafo_aleatorio(60, 240, semente)
+        assert dijkstra(grafo, 0, fila=fila) == dijkstra(grafo, 0)
+
+        custo, caminho = caminho_minimo(grafo, 0, 59, fila=fila)
+        assert custo == caminho_minimo(grafo, 0, 59)[0]
+        if caminho:
+            assert sum(min(p for w, p in grafo[u] if w == v) for u, v in zip(caminho, caminho[1:])) == pytest.approx(custo)
+
+def test_dial_igual_ao_dijkstra_com_pesos_inteiros():
+    for semente in range(10):
+        grafo = grafo_aleatorio(80, 400, semente)
+        assert escala_inteira(grafo) == 1
+        for destino in (None, 79):
+            esperado = dijkstra(grafo, 0, destino, predecessores=True)
+            assert dial(grafo, 0, destino, predecessores=True) == esperado
+            assert motor_caminhos(grafo)(grafo, 0, destino, predecessores=True) == esperado
+
+def test_motor_caminhos_escolhe_dial_ou_heap():
+    meios = {'A': [('B', 1.5), ('C', 2.0)], 'B': [('C', 0.5)], 'C': []}
+    assert escala_inteira(meios) == 2
+    assert motor_caminhos(meios)(meios, 'A') == {'A': 0.0, 'B': 1.5, 'C': 2.0}
+
+    assert escala_inteira({'A': [('B', 0.3)], 'B': []}) is None
+    assert escala_inteira({'A': [('B', 5000.0)], 'B': []}) is None
+    assert motor_caminhos({'A': [('B', 0.3)], 'B': []}) is dijkstra
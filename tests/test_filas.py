@@ -0,0 +1,44 @@
+import pytest
+import random
+
+from src.graphs.filas import FILAS, HeapIndexado, criar_fila
+
+
+@pytest.mark.parametrize("nome", sorted(FILAS))
+def test_filas_extraem_em_ordem_com_diminuicao(nome):
+    rnd = random.Random(5)
+    fila = criar_fila(nome)
+    prioridades = {}
+
+    for _ in range(2000):
+        item = rnd.randrange(300)
+        prioridade = rnd.uniform(0, 100)
+        if item not in prioridades or prioridade < prioridades[item]:
+            assert fila.inserir_ou_diminuir(item, prioridade)
+            prioridades[item] = prioridade
+        else:
+            assert not fila.inserir_ou_diminuir(item, prioridade)
+
+    assert len(fila) == len(prioridades)
+    extraidos = [fila.extrair() for _ in range(len(prioridades))]
+    assert extraidos == sorted((p, item) for item, p in prioridades.items())
+    assert len(fila) == 0
+
+    contadores = fila.contadores
+    assert contadores["insercoes"] == len(prioridades)
+    assert contadores["extracoes"] - contadores["extracoes_obsoletas"] == len(prioridades)
+
+
+def test_heap_indexado_nao_acumula_entradas_obsoletas():
+    fila = HeapIndexado(4)
+    for prioridade in range(10, 0, -1):
+        fila.inserir_ou_diminuir("A", float(prioridade))
+
+    assert len(fila) == 1
+    assert fila.contadores["diminuicoes"] == 9
+    assert fila.extrair() == (1.0, "A")
+
+
+def test_fila_desconhecida():
+    with pytest.raises(ValueError):
+        criar_fila("fibonacci")
@@ -0,0 +1,45 @@
+import pytest
+
+from src.geradores import gerar_adjacencias_bairros, gerar_adjacencias_voos
+from src.graphs.algorithms import bellman_ford_fila
+from src.graphs.io import iter_adjacencias, load_voos
+
+
+def test_bairros_sinteticos_no_formato_do_parser(tmp_path):
+    caminho = tmp_path / "adj.csv"
+    total = gerar_adjacencias_bairros(str(caminho), 500, semente=1)
+
+    linhas = list(iter_adjacencias(str(caminho)))
+    assert total == len(linhas) == 500
+    assert all(peso > 0 for _, _, _, _, peso in linhas)
+    assert linhas[0][3].startswith("Acesso por")
+
+
+def test_geradores_sao_deterministicos(tmp_path):
+    a, b = tmp_path / "a.csv", tmp_path / "b.csv"
+    gerar_adjacencias_voos(str(a), 300, semente=7)
+    gerar_adjacencias_voos(str(b), 300, semente=7)
+
+    assert a.read_bytes() == b.read_bytes()
+
+
+def test_voos_sinteticos_sem_ciclo_negativo(tmp_path):
+    caminho = tmp_path / "voos.csv"
+    gerar_adjacencias_voos(str(caminho), 2000, num_cidades=40, semente=3)
+
+    dataset = load_voos(str(caminho))
+    assert len(dataset.voos) == 2000
+    assert {classe for _, _, classe, _ in dataset.voos} == {"economica", "executiva"}
+
+    adj = dataset.adjacencia(assinada=True)
+    for origem in dataset.nos[:5]:
+        assert bellman_ford_fila(adj, origem)["ciclos"] == []
+
+
+def test_voos_sinteticos_com_ciclos_negativos(tmp_path):
+    caminho = tmp_path / "voos.csv"
+    gerar_adjacencias_voos(str(caminho), 200, num_cidades=20, ciclos_negativos=2, semente=3)
+
+    dataset = load_voos(str(caminho))
+    adj = dataset.adjacencia(assinada=True)
+    assert any(bellman_ford_fila(adj, origem)["ciclos"] for origem in dataset.nos)
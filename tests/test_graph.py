@@ -0,0 +1,47 @@
+import pytest
+from src.graphs.graph import Graph
+
+def test_graph_ignora_arestas_duplicadas():
+    g = Graph()
+    g.add_edges([
+        ('A', 'B', 1.0),
+        ('B', 'A', 3.0),
+        ('A', 'B', 2.0),
+        ('A', 'C', 4.0),
+    ])
+
+    assert g.neighbors('A') == [('B', 1.0), ('C', 4.0)]
+    assert g.neighbors('B') == [('A', 1.0)]
+    assert g.degree('A') == 2
+    assert g.has_edge('C', 'A')
+    assert not g.has_edge('B', 'C')
+
+
+def test_graph_mantem_arestas_e_contadores():
+    g = Graph()
+    g.add_edges([
+        ('A', 'B', 1.0),
+        ('B', 'C', 2.0),
+        ('C', 'A', 3.0),
+        ('B', 'A', 9.0),
+    ])
+
+    assert g.edges() == (('A', 'B', 1.0), ('B', 'C', 2.0), ('C', 'A', 3.0))
+    assert g.edges() is g.edges()
+    assert (g.ordem(), g.tamanho(), g.degree_sum()) == (3, 3, 6)
+    assert g.densidade() == 1.0
+
+    g.remove_edge('C', 'A')
+
+    assert g.edges() == (('A', 'B', 1.0), ('B', 'C', 2.0))
+    assert g.degree_sum() == 4
+    assert not g.has_edge('A', 'C')
+
+    g.add_edge('A', 'D', 4.0)
+    assert g.tamanho() == 3
+
+    with pytest.raises(AttributeError):
+        g.edges().append(('X', 'Y', 1.0))
+    assert g.edges() == (('A', 'B', 1.0), ('B', 'C', 2.0), ('A', 'D', 4.0))
+    assert g.tamanho() == 3
+    assert g.neighbors('A') == [('B', 1.0), ('D', 4.0)]
@@ -0,0 +1,26 @@
+import pytest
+from src.graphs.graph import Graph
+from src.graphs.indice import IndiceCaminhos
+from src.graphs.algorithms import caminho_minimo
+
+def test_indice_responde_como_dijkstra(tmp_path):
+    g = Graph()
+    g.add_edges([
+        ('A', 'B', 1.0),
+        ('B', 'C', 2.0),
+        ('A', 'C', 4.0),
+        ('C', 'D', 1.0),
+    ])
+    g.add_node('E')
+
+    indice = IndiceCaminhos.construir(g.adj, fonte_hash="abc")
+    caminho_arquivo = tmp_path / "indice.json"
+    indice.salvar(caminho_arquivo)
+    carregado = IndiceCaminhos.carregar(caminho_arquivo)
+
+    assert carregado.fonte_hash == "abc"
+    for origem in g.nodes():
+        for destino in g.nodes():
+            assert carregado.consultar(origem, destino) == caminho_minimo(g.adj, origem, destino)
+
+    assert carregado.consultar('A', 'Z') == (float('inf'), [])
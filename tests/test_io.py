@@ -0,0 +1,44 @@
+import pytest
+from src.graphs.io import iter_adjacencias, load_adjacencias, load_voos
+
+def test_iter_adjacencias_separa_campos_com_aspas(tmp_path):
+    arquivo = tmp_path / "adj.csv"
+    arquivo.write_text(
+        'Recife, Santo Amaro, Ponte de Limoeiro, “Acesso por Ponte”, 1.0\n'
+        'Santo Amaro, Soledade, Rua  Gervásio Pires, "Acesso por rua", 2.0\n'
+        '\n'
+        'linha invalida\n'
+        'Boa Vista, Paissandu, Rua Sem Peso, “Acesso por Rua”, x\n',
+        encoding="utf-8",
+    )
+
+    registros = iter_adjacencias(str(arquivo))
+
+    assert next(registros) == ('Recife', 'Santo Amaro', 'Ponte de Limoeiro', 'Acesso por Ponte', 1.0)
+    assert load_adjacencias(str(arquivo)) == [
+        ('Recife', 'Santo Amaro', 'Ponte de Limoeiro', 'Acesso por Ponte', 1.0),
+        ('Santo Amaro', 'Soledade', 'Rua  Gervásio Pires', 'Acesso por rua', 2.0),
+    ]
+
+
+def test_load_voos_agrega_dataset(tmp_path):
+    arquivo = tmp_path / "voos.csv"
+    arquivo.write_text(
+        'Origem, Destino, Classe, Peso\n'
+        'Mumbai, Delhi, Executiva, 20.0\n'
+        'Mumbai, Delhi, Economica, 5.0\n'
+        'Delhi, Chennai, Economica, 3.0\n',
+        encoding="utf-8",
+    )
+
+    dataset = load_voos(str(arquivo))
+
+    assert dataset.nos == ['Mumbai', 'Delhi', 'Chennai']
+    assert dataset.contagem_arestas == {('Mumbai', 'Delhi'): 2, ('Delhi', 'Chennai'): 1}
+    assert dataset.graus_saida == {'Mumbai': 2, 'Delhi': 1}
+    assert dataset.adjacencia(assinada=True) == {
+        'Mumbai': [('Delhi', 20.0), ('Delhi', -5.0)],
+        'Delhi': [('Chennai', -3.0)],
+        'Chennai': [],
+    }
+    assert dataset.estatisticas_graus()["grau_max"] == 2
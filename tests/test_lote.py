@@ -0,0 +1,34 @@
+import pytest
+from src.graphs.lote import agrupar_por_origem, consultar_lote
+
+GRAPH = {
+    'A': [('B', 1), ('C', 4)],
+    'B': [('C', 2), ('D', 5)],
+    'C': [('D', 1)],
+    'D': [],
+    'E': [('A', 1)]
+}
+
+def test_agrupar_por_origem():
+    grupos = agrupar_por_origem([('A', 'B'), ('E', 'D'), ('A', 'D'), ('B', None), ('B', 'C')])
+
+    assert grupos == {'A': ['B', 'D'], 'E': ['D'], 'B': None}
+
+
+@pytest.mark.parametrize("processos", [1, 2])
+def test_consultar_lote_responde_todos_os_pares(processos):
+    consultas = [('A', 'D'), ('E', 'D'), ('A', 'C'), ('D', 'A'), ('C', None)]
+
+    resultado = consultar_lote(GRAPH, consultas, "dijkstra", processos=processos)
+
+    assert resultado['A'] == {'D': 4, 'C': 3}
+    assert resultado['E'] == {'D': 5}
+    assert resultado['D'] == {'A': float('inf')}
+    assert resultado['C']['D'] == 1
+
+    camadas = consultar_lote(GRAPH, consultas, "bfs", processos=processos)
+    assert camadas['E'] == {'D': 3}
+    assert camadas['D'] == {'A': None}
+
+    alcance = consultar_lote(GRAPH, [('E', 'D'), ('D', 'E')], "dfs", processos=processos)
+    assert alcance == {'E': {'D': True}, 'D': {'E': False}}
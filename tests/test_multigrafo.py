@@ -0,0 +1,59 @@
+import pytest
+
+from src.graphs.io import DatasetVoos
+from src.graphs.multigrafo import MultiDiGraph
+
+
+def _multigrafo():
+    g = MultiDiGraph()
+    g.add_edges([
+        ("Mumbai", "Delhi", 20.0, "executiva"),
+        ("Mumbai", "Delhi", 5.0, "economica"),
+        ("Mumbai", "Delhi", 8.0, "economica"),
+        ("Delhi", "Mumbai", 3.0, "executiva"),
+    ])
+    return g
+
+
+def test_multigrafo_guarda_arestas_paralelas_dirigidas():
+    g = _multigrafo()
+
+    assert g.ordem() == 2
+    assert g.tamanho() == 4
+    assert g.num_pares() == 2
+    assert g.multiplicidade("Mumbai", "Delhi") == 3
+    assert g.multiplicidade("Delhi", "Chennai") == 0
+    assert g.out_degree("Mumbai") == 3
+    assert g.neighbors("Delhi") == [("Mumbai", 3.0)]
+
+
+def test_colapso_por_par_e_por_classe():
+    g = _multigrafo()
+
+    assert g.colapsar("min") == {"Mumbai": [("Delhi", 5.0)], "Delhi": [("Mumbai", 3.0)]}
+    assert g.colapsar("max")["Mumbai"] == [("Delhi", 20.0)]
+    assert g.colapsar("contagem")["Mumbai"] == [("Delhi", 3)]
+    assert g.agregar("min", por_classe=True) == {
+        ("Mumbai", "Delhi", "executiva"): 20.0,
+        ("Mumbai", "Delhi", "economica"): 5.0,
+        ("Delhi", "Mumbai", "executiva"): 3.0,
+    }
+    assert g.colapsar("min", peso=DatasetVoos.peso_assinado)["Mumbai"] == [("Delhi", -8.0)]
+
+    with pytest.raises(ValueError):
+        g.colapsar("media")
+
+
+def test_dataset_voos_adjacencia_colapsada():
+    dataset = DatasetVoos([
+        ("Mumbai", "Delhi", "executiva", 20.0),
+        ("Mumbai", "Delhi", "economica", 5.0),
+        ("Delhi", "Chennai", "economica", 3.0),
+    ])
+
+    assert dataset.adjacencia(colapsada=True) == {
+        "Mumbai": [("Delhi", 5.0)],
+        "Delhi": [("Chennai", 3.0)],
+        "Chennai": [],
+    }
+    assert dataset.adjacencia(assinada=True, colapsada=True)["Mumbai"] == [("Delhi", -5.0)]
@@ -0,0 +1,69 @@
+import pytest
+from functools import partial
+
+from src.graphs.algorithms import dijkstra, bellman_ford_fila
+from src.graphs.perfil import Perfil, ativar, contar, medido, medir
+from src.pipeline import Etapa, Pipeline
+
+
+def test_perfil_registra_contadores_dos_algoritmos():
+    grafo = {"A": [("B", 1.0), ("C", 4.0)], "B": [("C", 1.0)], "C": []}
+    perfil = Perfil()
+
+    with ativar(perfil), medir("consulta") as registro:
+        dijkstra(grafo, "A")
+        bellman_ford_fila(grafo, "A")
+
+    assert perfil.registros == [registro]
+    assert registro["parede"] >= 0 and registro["cpu"] >= 0
+    assert registro["contadores"]["dijkstra"] == {
+        "chamadas": 1,
+        "nos_fixados": 3,
+        "arestas_relaxadas": 3,
+        "insercoes_heap": 4,
+        "extracoes_heap": 4,
+        "extracoes_obsoletas": 1,
+    }
+    assert registro["contadores"]["bellman_ford"]["arestas_examinadas"] >= 3
+
+
+def test_medicoes_aninhadas_acumulam_no_pai():
+    perfil = Perfil()
+
+    @medido("interna")
+    def interna():
+        contar("teste", passos=2)
+        return [0] * 10000
+
+    with ativar(perfil), medir("externa"):
+        interna()
+        interna()
+
+    externa = perfil.registros[0]
+    assert [f["nome"] for f in externa["filhos"]] == ["interna", "interna"]
+    assert externa["contadores"] == {"teste": {"passos": 4}}
+    assert externa["pico_memoria_bytes"] >= externa["filhos"][0]["pico_memoria_bytes"] > 0
+
+
+def test_sem_perfil_ativo_nada_e_registrado():
+    with medir("ignorado") as registro:
+        contar("teste", passos=1)
+    assert registro is None
+
+
+def _escrever(caminho):
+    with open(caminho, "w", encoding="utf-8") as f:
+        f.write("ok")
+
+
+def test_pipeline_grava_perfil_e_cprofile_por_etapa(tmp_path):
+    saida = tmp_path / "saida.txt"
+    perfil = Perfil(str(tmp_path / "prof"))
+    etapas = [Etapa("escrever", partial(_escrever, str(saida)), [], [str(saida)])]
+
+    Pipeline(etapas, str(tmp_path / "manifesto.json")).executar(perfil=perfil)
+    perfil.salvar(str(tmp_path / "perfil.json"))
+
+    assert [r["nome"] for r in perfil.registros] == ["escrever"]
+    assert (tmp_path / "prof" / "escrever.prof").exists()
+    assert (tmp_path / "perfil.json").exists()
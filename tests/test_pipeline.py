@@ -0,0 +1,118 @@
+import pytest
+from functools import partial
+from src.pipeline import Etapa, Pipeline
+
+def test_pipeline_so_refaz_etapas_com_entradas_alteradas(tmp_path):
+    entrada = tmp_path / "entrada.txt"
+    intermediario = tmp_path / "intermediario.txt"
+    final = tmp_path / "final.txt"
+    entrada.write_text("a")
+    chamadas = []
+
+    def gerar_intermediario():
+        chamadas.append("intermediario")
+        intermediario.write_text(entrada.read_text().upper())
+
+    def gerar_final():
+        chamadas.append("final")
+        final.write_text(intermediario.read_text() * 2)
+
+    etapas = [
+        Etapa("final", gerar_final, [str(intermediario)], [str(final)]),
+        Etapa("intermediario", gerar_intermediario, [str(entrada)], [str(intermediario)]),
+    ]
+    pipeline = Pipeline(etapas, str(tmp_path / "manifesto.json"))
+
+    assert pipeline.ordem() == ["intermediario", "final"]
+    assert pipeline.executar() == {"intermediario": "executada", "final": "executada"}
+    assert pipeline.executar() == {"intermediario": "atualizada", "final": "atualizada"}
+
+    entrada.write_text("b")
+    pipeline.executar()
+    assert final.read_text() == "BB"
+    assert chamadas == ["intermediario", "final", "intermediario", "final"]
+
+
+def test_pipeline_bloqueia_dependentes_de_etapa_que_falhou(tmp_path):
+    saida = tmp_path / "saida.txt"
+
+    def falhar():
+        raise RuntimeError("erro")
+
+    etapas = [
+        Etapa("origem", falhar, [], [str(saida)]),
+        Etapa("destino", lambda: None, [str(saida)], [str(tmp_path / "x.txt")]),
+    ]
+
+    status = Pipeline(etapas, str(tmp_path / "manifesto.json")).executar()
+
+    assert status == {"origem": "falhou", "destino": "bloqueada"}
+
+
+def escrever(caminho, texto):
+    print(f"escrevendo {caminho}")
+    with open(caminho, "w") as f:
+        f.write(texto)
+
+def concatenar(destino, *origens):
+    partes = []
+    for origem in origens:
+        with open(origem) as f:
+            partes.append(f.read())
+    escrever(destino, "".join(partes))
+
+def test_pipeline_em_paralelo(tmp_path, capsys):
+    a, b, c = (str(tmp_path / nome) for nome in ("a.txt", "b.txt", "c.txt"))
+    etapas = [
+        Etapa("a", partial(escrever, a, "x"), [], [a]),
+        Etapa("b", partial(escrever, b, "y"), [], [b]),
+        Etapa("c", partial(concatenar, c, a, b), [a, b], [c]),
+    ]
+
+    status = Pipeline(etapas, str(tmp_path / "manifesto.json")).executar(processos=2)
+
+    assert status == {"a": "executada", "b": "executada", "c": "executada"}
+    with open(c) as f:
+        assert f.read() == "xy"
+    linhas = capsys.readouterr().out.splitlines()
+    assert linhas == [
+        f"escrevendo {a}", "[a] executada",
+        f"escrevendo {b}", "[b] executada",
+        f"escrevendo {c}", "[c] executada",
+    ]
+
+
+def test_pipeline_nao_registra_saidas_antigas_de_etapa_que_falhou(tmp_path):
+    entrada = tmp_path / "entrada.txt"
+    saida = tmp_path / "saida.txt"
+    entrada.write_text("a")
+    falhar = []
+
+    def gerar():
+        if falhar:
+            raise ValueError("entrada malformada")
+        saida.write_text(entrada.read_text())
+
+    pipeline = Pipeline(
+        [Etapa("gerar", gerar, [str(entrada)], [str(saida)])],
+        str(tmp_path / "manifesto.json"),
+    )
+    assert pipeline.executar() == {"gerar": "executada"}
+
+    entrada.write_text("b")
+    falhar.append(True)
+    assert pipeline.executar() == {"gerar": "falhou"}
+    assert saida.read_text() == "a"
+    assert pipeline.executar() == {"gerar": "falhou"}
+
+    falhar.clear()
+    assert pipeline.executar() == {"gerar": "executada"}
+    assert saida.read_text() == "b"
+
+def test_etapas_que_montam_grafos_dependem_do_codigo_dos_grafos():
+    from src.cli import CODIGO_GRAFOS, etapas_construir
+
+    etapas = {etapa.nome: etapa for etapa in etapas_construir()}
+    for nome in ("parte1_dados", "hierarquia_contracao", "grafo_interativo", "subgrafo_top10_grau"):
+        assert "src/solve.py" in etapas[nome].entradas
+        assert set(CODIGO_GRAFOS) <= set(etapas[nome].entradas)
@@ -0,0 +1,56 @@
+import pytest
+from src.graphs.graph import Graph
+import src.solve as solve
+from src.solve import agrupar_nos_microrregioes, calcular_ego
+
+def test_calcular_ego_conta_triangulos_e_segundo_nivel():
+    g = Graph()
+    g.add_edges([
+        ('A', 'B', 1.0),
+        ('A', 'C', 1.0),
+        ('B', 'C', 1.0),
+        ('C', 'D', 1.0),
+        ('D', 'E', 1.0),
+    ])
+
+    ego = {linha[0]: linha[1:] for linha in calcular_ego(g)}
+
+    assert ego['A'] == (2, 3, 3, 1.0, 1.0, 4)
+    grau, ordem, tamanho, densidade, coef, ordem_2 = ego['C']
+    assert (grau, ordem, tamanho, ordem_2) == (3, 4, 4, 5)
+    assert densidade == pytest.approx(2 * 4 / (4 * 3))
+    assert coef == pytest.approx(1 / 3)
+    assert ego['E'] == (1, 2, 1, 1.0, 0.0, 3)
+
+
+def test_agrupar_microrregioes_com_cortes():
+    g = Graph()
+    g.add_edges([
+        ('A', 'B', 1.0),
+        ('B', 'C', 1.0),
+        ('C', 'D', 1.0),
+        ('D', 'X', 1.0),
+    ])
+    micro = {'A': '1', 'B': '1', 'C': '2', 'D': '2'}
+
+    resultados = {r["microrregiao"]: r for r in agrupar_nos_microrregioes(g, micro)}
+
+    assert resultados['1']["tamanho"] == 1
+    assert resultados['1']["corte"] == 1
+    assert resultados['1']["arestas_entre"] == {'2': 1}
+    assert resultados['1']["condutancia"] == pytest.approx(1 / 3)
+    assert resultados['2']["corte"] == 2
+    assert resultados['2']["densidade"] == 1.0
+
+
+@pytest.mark.parametrize("carregar", [solve.carregar_indice_caminhos, solve.carregar_hierarquia_contracao])
+def test_indices_salvos_dependem_da_versao_do_parser(tmp_path, monkeypatch, carregar):
+    csv_path = "data/adjacencias_bairros.csv"
+    grafo = solve.construir_grafo(csv_path, cache_dir=None)
+    arquivo = str(tmp_path / "indice.json")
+
+    primeiro = carregar(csv_path, grafo, arquivo)
+    assert carregar(csv_path, grafo, arquivo).fonte_hash == primeiro.fonte_hash
+
+    monkeypatch.setattr(solve, "VERSAO_PARSER", solve.VERSAO_PARSER + 1)
+    assert carregar(csv_path, grafo, arquivo).fonte_hash != primeiro.fonte_hash